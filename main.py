@@ -6,7 +6,10 @@ QQ群日常分析插件
 """
 
 import asyncio
+import functools
 import os
+import time
+from datetime import datetime
 
 from astrbot.api import AstrBotConfig, logger
 from astrbot.api.event import AstrMessageEvent, filter
@@ -41,8 +44,95 @@ from .src.infrastructure.platform.template_preview import (
 from .src.infrastructure.reporting.generators import ReportGenerator
 from .src.infrastructure.scheduler.auto_scheduler import AutoScheduler
 from .src.infrastructure.scheduler.retry import RetryManager
+from .src.utils.async_cache import memoize_async
 from .src.utils.pdf_utils import PDFInstaller
 
+# 插件根目录（导入时计算一次）
+_PLUGIN_DIR = os.path.dirname(__file__)
+
+# /分析设置 enable/disable 在各名单模式下的操作：(是否加入名单, 名单名称)
+_GROUP_LIST_OPS = {
+    ("enable", "whitelist"): (True, "白名单"),
+    ("enable", "blacklist"): (False, "黑名单"),
+    ("disable", "whitelist"): (False, "白名单"),
+    ("disable", "blacklist"): (True, "黑名单"),
+}
+
+# 无限制模式下 enable/disable 的提示
+_UNRESTRICTED_MODE_HINTS = {
+    "enable": "ℹ️ 当前为无限制模式，所有群聊默认启用",
+    "disable": "ℹ️ 当前为无限制模式，如需禁用请切换到黑名单模式",
+}
+
+# /分析设置 status 的输出模板
+_STATUS_TEMPLATE = "\n".join(
+    (
+        "📊 当前群分析功能状态:",
+        "• 群分析功能: {status} (模式: {mode})",
+        "• 自动分析: {auto_status} ({auto_time})",
+        "• 增量分析: {incremental_status}",
+        "• 调试模式: {debug_status} (增量立即报告)",
+        "• 输出格式: {output_format}",
+        "• PDF 功能: {pdf_status}",
+        "• 最小消息数: {min_threshold}",
+        "",
+        "💡 可用命令: enable, disable, status, reload, test, incremental_debug",
+        "💡 支持的输出格式: image, text, pdf (图片和PDF包含活跃度可视化)",
+        "💡 其他命令: /设置格式, /安装PDF, /增量状态",
+    )
+)
+
+# /设置格式 无参数时的帮助文本
+_FORMAT_HELP_TEMPLATE = """📊 当前输出格式: {current_format}
+
+可用格式:
+• image - 图片格式 (默认)
+• text - 文本格式
+• pdf - PDF 格式 {pdf_status}
+
+用法: /设置格式 [格式名称]"""
+
+# /设置模板 无参数时的帮助文本
+_TEMPLATE_HELP_TEMPLATE = """🎨 当前报告模板: {current_template}
+
+可用模板:
+{template_list}
+
+用法: /设置模板 [模板名称或序号]
+💡 使用 /查看模板 查看预览图"""
+
+
+@functools.lru_cache(maxsize=8)
+def _render_format_help(current_format: str, pdf_available: bool) -> str:
+    """渲染输出格式帮助文本（按参数缓存）"""
+    pdf_status = "✅" if pdf_available else "❌ (需安装 Playwright)"
+    return _FORMAT_HELP_TEMPLATE.format(
+        current_format=current_format, pdf_status=pdf_status
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _render_template_help(current_template: str, templates: tuple[str, ...]) -> str:
+    """渲染报告模板帮助文本（按参数缓存）"""
+    template_list = "\n".join(f"【{i}】{t}" for i, t in enumerate(templates, start=1))
+    return _TEMPLATE_HELP_TEMPLATE.format(
+        current_template=current_template, template_list=template_list
+    )
+
+
+def _require_group_chat(handler):
+    """命令前置检查：非群聊环境直接提示并返回，不进入命令主体"""
+
+    @functools.wraps(handler)
+    async def wrapper(self, event: AstrMessageEvent, *args, **kwargs):
+        if not self._get_group_id_from_event(event):
+            yield event.plain_result("❌ 请在群聊中使用此命令")
+            return
+        async for result in handler(self, event, *args, **kwargs):
+            yield result
+
+    return wrapper
+
 
 class QQGroupDailyAnalysis(Star):
     """QQ群日常分析插件主类"""
@@ -72,6 +162,10 @@ class QQGroupDailyAnalysis(Star):
         # 4. 增量分析组件
         self.incremental_store = IncrementalStore(self)
         self.incremental_merge_service = IncrementalMergeService()
+        # /增量状态 摘要缓存 {群号: ((索引版本, 窗口起点分钟), 摘要)}
+        self._incremental_summary_cache: dict[
+            str, tuple[tuple[int, int], dict | None]
+        ] = {}
 
         # 5. 应用层
         self.analysis_service = AnalysisApplicationService(
@@ -90,9 +184,7 @@ class QQGroupDailyAnalysis(Star):
         self.message_processing_service = MessageProcessingService(
             context, self.telegram_group_registry
         )
-        self.template_command_service = TemplateCommandService(
-            plugin_root=os.path.dirname(__file__)
-        )
+        self.template_command_service = TemplateCommandService(plugin_root=_PLUGIN_DIR)
         self.telegram_template_preview_handler = TelegramTemplatePreviewHandler(
             config_manager=self.config_manager,
             template_service=self.template_command_service,
@@ -116,6 +208,8 @@ class QQGroupDailyAnalysis(Star):
         )
 
         self._initialized = False
+        # 重载任务与 on_platform_loaded 可能同时被唤醒，用锁保证只初始化一次
+        self._init_lock = asyncio.Lock()
         # 异步注册任务，处理插件重载情况
         asyncio.create_task(self._run_initialization("Plugin Reload/Init"))
 
@@ -125,6 +219,7 @@ class QQGroupDailyAnalysis(Star):
     @filter.on_platform_loaded()
     async def on_platform_loaded(self):
         """平台加载完成后初始化"""
+        self.bot_manager.ready_event.set()
         await self._run_initialization("Platform Loaded")
 
     async def _run_initialization(self, source: str):
@@ -132,45 +227,48 @@ class QQGroupDailyAnalysis(Star):
         if self._initialized:
             return
 
-        # 稍微延迟，确保 context 和环境稳定
-        await asyncio.sleep(2)
-        if self._initialized:  # Double check after sleep
-            return
+        # 等待平台就绪（平台加载完成或已有适配器注册），最多等待 2 秒
+        if not self.bot_manager.ready_event.is_set():
+            try:
+                await asyncio.wait_for(self.bot_manager.ready_event.wait(), timeout=2)
+            except asyncio.TimeoutError:
+                pass
 
-        try:
-            logger.info(f"正在执行插件初始化 (来源: {source})...")
-            # 检查插件是否被启用 (Fix for empty plugin_set issue)
-            if self.context:
-                config = self.context.get_config()
-                # ... 为空修正逻辑保持不变 ...
-                plugin_set = config.get("plugin_set", [])
-                if (
-                    isinstance(plugin_set, list)
-                    and "astrbot_plugin_qq_group_daily_analysis" not in plugin_set
-                ):
-                    # 此时不强制修改 config，但可以记录日志
-                    pass
+        # 检查与初始化必须在同一把锁内完成，避免两个入口都通过检查
+        async with self._init_lock:
+            if self._initialized:  # Double check after wait
+                return
 
-            # 初始化所有bot实例
-            discovered = await self.bot_manager.initialize_from_config()
-            if discovered:
-                logger.info("Bot管理器初始化成功")
-                await self.template_preview_router.ensure_handlers_registered(
-                    self.context
+            try:
+                logger.info(f"正在执行插件初始化 (来源: {source})...")
+
+                # 初始化所有bot实例，同时预扫描模板目录（互不依赖，并发执行）
+                discovered, prescan = await asyncio.gather(
+                    self.bot_manager.initialize_from_config(),
+                    self.template_command_service.list_available_templates(),
+                    return_exceptions=True,
                 )
-                # 启动调度器
-                self.auto_scheduler.schedule_jobs(self.context)
-            else:
-                logger.warning("Bot管理器初始化失败，未发现任何适配器")
+                if isinstance(discovered, BaseException):
+                    raise discovered
+                if isinstance(prescan, BaseException):
+                    logger.warning(f"预扫描模板目录失败: {prescan}")
+                if discovered:
+                    logger.info("Bot管理器初始化成功")
+                    # 启动调度器（同步注册，先于需要等待的预览处理器注册）
+                    self.auto_scheduler.schedule_jobs(self.context)
+                    await self.template_preview_router.ensure_handlers_registered(
+                        self.context
+                    )
+                else:
+                    logger.warning("Bot管理器初始化失败，未发现任何适配器")
 
-            # 始终启动重试管理器
-            await self.retry_manager.start()
+                # 重试管理器的 worker 在首次加入重试任务时按需启动 (见 add_task)
 
-            self._initialized = True
-            logger.info("插件任务注册完成")
+                self._initialized = True
+                logger.info("插件任务注册完成")
 
-        except Exception as e:
-            logger.error(f"插件初始化失败: {e}", exc_info=True)
+            except Exception as e:
+                logger.error(f"插件初始化失败: {e}", exc_info=True)
 
     async def terminate(self):
         """插件被卸载/停用时调用，清理资源"""
@@ -183,10 +281,25 @@ class QQGroupDailyAnalysis(Star):
                 self.auto_scheduler.unschedule_jobs(self.context)
                 logger.info("自动调度器已停止")
 
+            # 以下清理互不依赖，并发执行以缩短卸载耗时
+            shutdowns = {}
+            if self.message_processing_service:
+                shutdowns["消息处理服务"] = self.message_processing_service.close()
             if self.retry_manager:
-                await self.retry_manager.stop()
+                shutdowns["重试管理器"] = self.retry_manager.stop()
             if self.template_preview_router:
-                await self.template_preview_router.unregister_handlers()
+                shutdowns["模板预览处理器"] = (
+                    self.template_preview_router.unregister_handlers()
+                )
+            if self.report_generator:
+                shutdowns["报告生成器"] = self.report_generator.close()
+            if self.telegram_group_registry:
+                shutdowns["Telegram 群注册表"] = self.telegram_group_registry.close()
+
+            results = await asyncio.gather(*shutdowns.values(), return_exceptions=True)
+            for name, result in zip(shutdowns, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"{name}清理失败: {result}")
 
             # 重置实例属性
             self.auto_scheduler = None
@@ -242,16 +355,13 @@ class QQGroupDailyAnalysis(Star):
             return event.get_platform_id()
         except Exception:
             # 后备方案：从元数据获取
-            if (
-                hasattr(event, "platform_meta")
-                and event.platform_meta
-                and hasattr(event.platform_meta, "id")
-            ):
-                return event.platform_meta.id
-            return "default"
+            platform_meta = getattr(event, "platform_meta", None)
+            platform_id = getattr(platform_meta, "id", None) if platform_meta else None
+            return platform_id if platform_id is not None else "default"
 
     @filter.command("群分析", alias={"group_analysis"})
     @filter.permission_type(PermissionType.ADMIN)
+    @_require_group_chat
     async def analyze_group_daily(
         self, event: AstrMessageEvent, days: int | None = None
     ):
@@ -261,10 +371,9 @@ class QQGroupDailyAnalysis(Star):
         """
         group_id = self._get_group_id_from_event(event)
         platform_id = self._get_platform_id_from_event(event)
-
-        if not group_id:
-            yield event.plain_result("❌ 请在群聊中使用此命令")
-            return
+        # 结果构造方法在各分支中多次使用，绑定为局部变量
+        plain_result = event.plain_result
+        image_result = event.image_result
 
         # 更新bot实例
         self.bot_manager.update_from_event(event)
@@ -279,10 +388,15 @@ class QQGroupDailyAnalysis(Star):
             # But if list item HAS colon, we need precise match.
             # If prompt fails, try simple ID as fallback for permissive cases?
             # No, config_manager.is_group_allowed already handles simple ID matching if whitelist item is simple ID.
-            yield event.plain_result("❌ 此群未启用日常分析功能")
+            yield plain_result("❌ 此群未启用日常分析功能")
+            return
+
+        # 无可用适配器时直接失败，避免先发送进度提示再报错
+        if not self.bot_manager.get_adapter(platform_id):
+            yield plain_result(f"❌ 未找到平台 {platform_id} 的适配器")
             return
 
-        yield event.plain_result("🔍 正在启动跨平台分析引擎，正在拉取最近消息...")
+        yield plain_result("🔍 正在启动跨平台分析引擎，正在拉取最近消息...")
 
         try:
             # 调用 DDD 应用级服务
@@ -293,12 +407,12 @@ class QQGroupDailyAnalysis(Star):
             if not result.get("success"):
                 reason = result.get("reason")
                 if reason == "no_messages":
-                    yield event.plain_result("❌ 未找到足够的群聊记录")
+                    yield plain_result("❌ 未找到足够的群聊记录")
                 else:
-                    yield event.plain_result("❌ 分析失败，原因未知")
+                    yield plain_result("❌ 分析失败，原因未知")
                 return
 
-            yield event.plain_result(
+            yield plain_result(
                 f"📊 已获取{result['messages_count']}条消息，正在生成渲染报告..."
             )
 
@@ -307,10 +421,13 @@ class QQGroupDailyAnalysis(Star):
             output_format = self.config_manager.get_output_format()
 
             # 定义头像获取回调 (Infrastructure delegate)
+            # 报告中同一用户会被多次引用，回调结果在本次命令内缓存
+            @memoize_async
             async def avatar_getter(user_id: str) -> str | None:
                 return await adapter.get_user_avatar_url(user_id)
 
             # 定义昵称获取回调
+            @memoize_async
             async def nickname_getter(user_id: str) -> str | None:
                 try:
                     member = await adapter.get_member_info(group_id, user_id)
@@ -334,9 +451,9 @@ class QQGroupDailyAnalysis(Star):
 
                 if image_url:
                     if not await adapter.send_image(group_id, image_url):
-                        yield event.image_result(image_url)
+                        yield image_result(image_url)
                 elif html_content:
-                    yield event.plain_result("⚠️ 图片生成暂不可用，已尝试加入队列。")
+                    yield plain_result("⚠️ 图片生成暂不可用，已尝试加入队列。")
                     await self.retry_manager.add_task(
                         html_content, analysis_result, group_id, platform_id
                     )
@@ -344,68 +461,50 @@ class QQGroupDailyAnalysis(Star):
                     text_report = self.report_generator.generate_text_report(
                         analysis_result
                     )
-                    yield event.plain_result(
-                        f"⚠️ 图片生成失败，回退文本：\n\n{text_report}"
-                    )
+                    yield plain_result(f"⚠️ 图片生成失败，回退文本：\n\n{text_report}")
 
             elif output_format == "pdf":
                 pdf_path = await self.report_generator.generate_pdf_report(
                     analysis_result,
                     group_id,
                     avatar_getter=avatar_getter,
-                    nickname_getter=nickname_getter,
                 )
                 if pdf_path:
                     if not await adapter.send_file(group_id, pdf_path):
-                        from pathlib import Path
-
                         yield event.chain_result(
-                            [File(name=Path(pdf_path).name, file=pdf_path)]
+                            [File(name=os.path.basename(pdf_path), file=pdf_path)]
                         )
                 else:
-                    yield event.plain_result("⚠️ PDF 生成失败。")
+                    yield plain_result("⚠️ PDF 生成失败。")
 
             else:
                 text_report = self.report_generator.generate_text_report(
                     analysis_result
                 )
                 if not await adapter.send_text(group_id, text_report):
-                    yield event.plain_result(text_report)
+                    yield plain_result(text_report)
 
         except Exception as e:
             logger.error(f"群分析失败: {e}", exc_info=True)
-            yield event.plain_result(
+            yield plain_result(
                 f"❌ 分析失败: {str(e)}。请检查网络连接和LLM配置，或联系管理员"
             )
 
     @filter.command("设置格式", alias={"set_format"})
     @filter.permission_type(PermissionType.ADMIN)
+    @_require_group_chat
     async def set_output_format(self, event: AstrMessageEvent, format_type: str = ""):
         """
         设置分析报告输出格式（跨平台支持）
         用法: /设置格式 [image|text|pdf]
         """
-        group_id = self._get_group_id_from_event(event)
-
-        if not group_id:
-            yield event.plain_result("❌ 请在群聊中使用此命令")
-            return
-
         if not format_type:
-            current_format = self.config_manager.get_output_format()
-            pdf_status = (
-                "✅"
-                if self.config_manager.playwright_available
-                else "❌ (需安装 Playwright)"
+            yield event.plain_result(
+                _render_format_help(
+                    self.config_manager.get_output_format(),
+                    self.config_manager.playwright_available,
+                )
             )
-            yield event.plain_result(f"""📊 当前输出格式: {current_format}
-
-可用格式:
-• image - 图片格式 (默认)
-• text - 文本格式
-• pdf - PDF 格式 {pdf_status}
-
-用法: /设置格式 [格式名称]""")
             return
 
         format_type = format_type.lower()
@@ -437,17 +536,12 @@ class QQGroupDailyAnalysis(Star):
         )
 
         if not template_input:
-            current_template = self.config_manager.get_report_template()
-            template_list_str = "\n".join(
-                [f"【{i}】{t}" for i, t in enumerate(available_templates, start=1)]
+            yield event.plain_result(
+                _render_template_help(
+                    self.config_manager.get_report_template(),
+                    tuple(available_templates),
+                )
             )
-            yield event.plain_result(f"""🎨 当前报告模板: {current_template}
-
-可用模板:
-{template_list_str}
-
-用法: /设置模板 [模板名称或序号]
-💡 使用 /查看模板 查看预览图""")
             return
 
         template_name, parse_error = self.template_command_service.parse_template_input(
@@ -457,7 +551,7 @@ class QQGroupDailyAnalysis(Star):
             yield event.plain_result(parse_error)
             return
 
-        if not await self.template_command_service.template_exists(template_name):
+        if not self.template_command_service.has_template(template_name):
             yield event.plain_result(f"❌ 模板 '{template_name}' 不存在")
             return
 
@@ -506,6 +600,24 @@ class QQGroupDailyAnalysis(Star):
         )
         yield event.chain_result([preview_nodes])
 
+    @filter.command("刷新模板", alias={"refresh_templates"})
+    @filter.permission_type(PermissionType.ADMIN)
+    async def refresh_templates(self, event: AstrMessageEvent):
+        """
+        强制重新扫描报告模板与预览图（跨平台支持）
+        用法: /刷新模板
+        """
+        # 命令由插件处理，禁用默认 LLM 回退。
+        event.should_call_llm(True)
+
+        self.template_command_service.invalidate_cache()
+        available_templates = (
+            await self.template_command_service.list_available_templates()
+        )
+        yield event.plain_result(
+            f"✅ 模板列表已刷新，共 {len(available_templates)} 个可用模板"
+        )
+
     @filter.command("安装PDF", alias={"install_pdf"})
     @filter.permission_type(PermissionType.ADMIN)
     async def install_pdf_deps(self, event: AstrMessageEvent):
@@ -525,6 +637,7 @@ class QQGroupDailyAnalysis(Star):
 
     @filter.command("分析设置", alias={"analysis_settings"})
     @filter.permission_type(PermissionType.ADMIN)
+    @_require_group_chat
     async def analysis_settings(self, event: AstrMessageEvent, action: str = "status"):
         """
         管理分析设置（跨平台支持）
@@ -538,87 +651,34 @@ class QQGroupDailyAnalysis(Star):
         """
         group_id = self._get_group_id_from_event(event)
 
-        if not group_id:
-            yield event.plain_result("❌ 请在群聊中使用此命令")
-            return
-
-        elif action == "enable":
+        if action in _UNRESTRICTED_MODE_HINTS:
             mode = self.config_manager.get_group_list_mode()
             target_id = event.unified_msg_origin or group_id  # 优先使用 UMO
+            list_op = _GROUP_LIST_OPS.get((action, mode))
 
-            if mode == "whitelist":
-                glist = self.config_manager.get_group_list()
-                # 检查 UMO 或 Group ID 是否已在列表中
-                if not self.config_manager.is_group_allowed(target_id):
-                    glist.append(target_id)
-                    self.config_manager.set_group_list(glist)
-                    yield event.plain_result(
-                        f"✅ 已将当前群加入白名单\nID: {target_id}"
-                    )
-                    self.auto_scheduler.schedule_jobs(self.context)
-                else:
-                    yield event.plain_result("ℹ️ 当前群已在白名单中")
-            elif mode == "blacklist":
-                glist = self.config_manager.get_group_list()
-
-                # 尝试移除 UMO 和 Group ID
-                removed = False
-                if target_id in glist:
-                    glist.remove(target_id)
-                    removed = True
-                if group_id in glist:
-                    glist.remove(group_id)
-                    removed = True
-
-                if removed:
-                    self.config_manager.set_group_list(glist)
-                    yield event.plain_result("✅ 已将当前群从黑名单移除")
-                    self.auto_scheduler.schedule_jobs(self.context)
-                else:
-                    yield event.plain_result("ℹ️ 当前群不在黑名单中")
-            else:
-                yield event.plain_result("ℹ️ 当前为无限制模式，所有群聊默认启用")
-
-        elif action == "disable":
-            mode = self.config_manager.get_group_list_mode()
-            target_id = event.unified_msg_origin or group_id  # 优先使用 UMO
+            if list_op is None:
+                yield event.plain_result(_UNRESTRICTED_MODE_HINTS[action])
+                return
 
-            if mode == "whitelist":
-                glist = self.config_manager.get_group_list()
-
-                # 尝试移除 UMO 和 Group ID
-                removed = False
-                if target_id in glist:
-                    glist.remove(target_id)
-                    removed = True
-                if group_id in glist:
-                    glist.remove(group_id)
-                    removed = True
-
-                if removed:
-                    self.config_manager.set_group_list(glist)
-                    yield event.plain_result("✅ 已将当前群从白名单移除")
-                    self.auto_scheduler.schedule_jobs(self.context)
-                else:
-                    yield event.plain_result("ℹ️ 当前群不在白名单中")
-            elif mode == "blacklist":
-                glist = self.config_manager.get_group_list()
+            add_to_list, list_name = list_op
+            if add_to_list:
                 # 检查 UMO 或 Group ID 是否已在列表中
-                if self.config_manager.is_group_allowed(
-                    target_id
-                ):  # 如果允许，说明不在黑名单
-                    glist.append(target_id)
-                    self.config_manager.set_group_list(glist)
+                # 白名单模式下允许即在名单中，黑名单模式下允许即不在名单中
+                allowed = self.config_manager.is_group_allowed(target_id)
+                if allowed != (mode == "whitelist"):
+                    self.config_manager.add_group(target_id)
                     yield event.plain_result(
-                        f"✅ 已将当前群加入黑名单\nID: {target_id}"
+                        f"✅ 已将当前群加入{list_name}\nID: {target_id}"
                     )
                     self.auto_scheduler.schedule_jobs(self.context)
                 else:
-                    yield event.plain_result("ℹ️ 当前群已在黑名单中")
+                    yield event.plain_result(f"ℹ️ 当前群已在{list_name}中")
+            # 尝试移除 UMO 和 Group ID
+            elif self.config_manager.remove_group(target_id, group_id):
+                yield event.plain_result(f"✅ 已将当前群从{list_name}移除")
+                self.auto_scheduler.schedule_jobs(self.context)
             else:
-                yield event.plain_result(
-                    "ℹ️ 当前为无限制模式，如需禁用请切换到黑名单模式"
-                )
+                yield event.plain_result(f"ℹ️ 当前群不在{list_name}中")
 
         elif action == "reload":
             self.auto_scheduler.schedule_jobs(self.context)
@@ -661,75 +721,71 @@ class QQGroupDailyAnalysis(Star):
                 )
 
             is_allowed = self.config_manager.is_group_allowed(check_target)
-            status = "已启用" if is_allowed else "未启用"
-            mode = self.config_manager.get_group_list_mode()
-
-            auto_status = (
-                "已启用" if self.config_manager.get_enable_auto_analysis() else "未启用"
-            )
-            auto_time = self.config_manager.get_auto_analysis_time()
-
-            pdf_status = PDFInstaller.get_pdf_status(self.config_manager)
-            output_format = self.config_manager.get_output_format()
-            min_threshold = self.config_manager.get_min_messages_threshold()
+            cfg = self.config_manager.get_all_status()
 
             # 增量分析状态
-            incremental_enabled = self.config_manager.get_incremental_enabled()
             incremental_status_text = "未启用"
-            if incremental_enabled:
-                interval = self.config_manager.get_incremental_interval_minutes()
-                max_daily = self.config_manager.get_incremental_max_daily_analyses()
-                active_start = self.config_manager.get_incremental_active_start_hour()
-                active_end = self.config_manager.get_incremental_active_end_hour()
+            if cfg.incremental_enabled:
                 incremental_status_text = (
-                    f"已启用 (间隔{interval}分钟, 最多{max_daily}次/天, "
-                    f"活跃时段{active_start}:00-{active_end}:00)"
+                    f"已启用 (间隔{cfg.incremental_interval_minutes}分钟, "
+                    f"最多{cfg.incremental_max_daily_analyses}次/天, "
+                    f"活跃时段{cfg.incremental_active_start_hour}:00-"
+                    f"{cfg.incremental_active_end_hour}:00)"
                 )
 
-            debug_report = self.config_manager.get_incremental_report_immediately()
-            debug_status = "✅ 开启" if debug_report else "❌ 关闭"
-
-            yield event.plain_result(f"""📊 当前群分析功能状态:
-• 群分析功能: {status} (模式: {mode})
-• 自动分析: {auto_status} ({auto_time})
-• 增量分析: {incremental_status_text}
-• 调试模式: {debug_status} (增量立即报告)
-• 输出格式: {output_format}
-• PDF 功能: {pdf_status}
-• 最小消息数: {min_threshold}
-
-💡 可用命令: enable, disable, status, reload, test, incremental_debug
-💡 支持的输出格式: image, text, pdf (图片和PDF包含活跃度可视化)
-💡 其他命令: /设置格式, /安装PDF, /增量状态""")
+            yield event.plain_result(
+                _STATUS_TEMPLATE.format(
+                    status="已启用" if is_allowed else "未启用",
+                    mode=cfg.group_list_mode,
+                    auto_status="已启用" if cfg.enable_auto_analysis else "未启用",
+                    auto_time=cfg.auto_analysis_time,
+                    incremental_status=incremental_status_text,
+                    debug_status=(
+                        "✅ 开启" if cfg.incremental_report_immediately else "❌ 关闭"
+                    ),
+                    output_format=cfg.output_format,
+                    pdf_status=PDFInstaller.get_pdf_status(self.config_manager),
+                    min_threshold=cfg.min_messages_threshold,
+                )
+            )
 
     @filter.command("增量状态", alias={"incremental_status"})
     @filter.permission_type(PermissionType.ADMIN)
+    @_require_group_chat
     async def incremental_status(self, event: AstrMessageEvent):
         """查看当前增量分析状态（滑动窗口）"""
         group_id = self._get_group_id_from_event(event)
-        if not group_id:
-            yield event.plain_result("❌ 请在群聊中使用此命令")
-            return
 
         if not self.config_manager.get_incremental_enabled():
             yield event.plain_result("ℹ️ 增量分析模式未启用，请在插件配置中开启")
             return
 
-        import time as time_mod
-
         # 计算滑动窗口范围
         analysis_days = self.config_manager.get_analysis_days()
-        window_end = time_mod.time()
+        window_end = time.time()
         window_start = window_end - (analysis_days * 24 * 3600)
 
-        # 查询窗口内的批次
-        batches = await self.incremental_store.query_batches(
-            group_id, window_start, window_end
+        # 同一分钟内且批次未变化时直接复用上次的摘要
+        cache_key = (
+            self.incremental_store.get_index_version(group_id),
+            int(window_start // 60),
         )
+        cached = self._incremental_summary_cache.get(group_id)
+        if cached is not None and cached[0] == cache_key:
+            summary = cached[1]
+        else:
+            # 流式读取窗口内的批次并逐批合并，无需一次性持有全部批次
+            merge_service = self.incremental_merge_service
+            state = merge_service.new_state(window_start, window_end)
+            async for batch in self.incremental_store.iter_batches(
+                group_id, window_start, window_end
+            ):
+                merge_service.fold_batch(state, batch)
 
-        if not batches:
-            from datetime import datetime
+            summary = state.get_summary() if state.total_analysis_count else None
+            self._incremental_summary_cache[group_id] = (cache_key, summary)
 
+        if summary is None:
             start_str = datetime.fromtimestamp(window_start).strftime("%m-%d %H:%M")
             end_str = datetime.fromtimestamp(window_end).strftime("%m-%d %H:%M")
             yield event.plain_result(
@@ -737,12 +793,6 @@ class QQGroupDailyAnalysis(Star):
             )
             return
 
-        # 合并批次获取聚合视图
-        state = self.incremental_merge_service.merge_batches(
-            batches, window_start, window_end
-        )
-        summary = state.get_summary()
-
         yield event.plain_result(
             f"📊 增量分析状态 (窗口: {summary['window']})\n"
             f"• 分析次数: {summary['total_analyses']}\n"
@@ -752,25 +802,3 @@ class QQGroupDailyAnalysis(Star):
             f"• 参与者: {summary['participants']}\n"
             f"• 高峰时段: {summary['peak_hours']}"
         )
-
-    def _get_group_id_from_event(self, event: AstrMessageEvent) -> str | None:
-        """从消息事件中安全获取群组 ID"""
-        try:
-            group_id = event.get_group_id()
-            return group_id if group_id else None
-        except Exception:
-            return None
-
-    def _get_platform_id_from_event(self, event: AstrMessageEvent) -> str:
-        """从消息事件中获取平台唯一 ID"""
-        try:
-            return event.get_platform_id()
-        except Exception:
-            # 后备方案：从元数据获取
-            if (
-                hasattr(event, "platform_meta")
-                and event.platform_meta
-                and hasattr(event.platform_meta, "id")
-            ):
-                return event.platform_meta.id
-            return "default"
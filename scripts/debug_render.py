@@ -132,30 +132,13 @@ async def debug_render(
             contributors=["赵六", "孙七"],
             detail="[112233445] 提议去吃黄焖鸡，但群友对螺蛳粉的优劣进行了长达一小时的辩论，最终未能达成共识。",
         ),
-        SummaryTopic(
-            topic="新出的3A大作测评",
-            contributors=["周八", "吴九"],
-            detail="[123456789] 分享了最新游戏的通关体验，讨论了画面表现和剧情走向。",
-        ),
-        SummaryTopic(
-            topic="新出的3A大作测评",
-            contributors=["周八", "吴九"],
-            detail="[123456789] 分享了最新游戏的通关体验，讨论了画面表现和剧情走向。",
-        ),
-        SummaryTopic(
-            topic="新出的3A大作测评",
-            contributors=["周八", "吴九"],
-            detail="[123456789] 分享了最新游戏的通关体验，讨论了画面表现和剧情走向。",
-        ),
-        SummaryTopic(
-            topic="新出的3A大作测评",
-            contributors=["周八", "吴九"],
-            detail="[123456789] 分享了最新游戏的通关体验，讨论了画面表现和剧情走向。",
-        ),
-        SummaryTopic(
-            topic="新出的3A大作测评",
-            contributors=["周八", "吴九"],
-            detail="[123456789] 分享了最新游戏的通关体验，讨论了画面表现和剧情走向。",
+        *(
+            SummaryTopic(
+                topic="新出的3A大作测评",
+                contributors=["周八", "吴九"],
+                detail="[123456789] 分享了最新游戏的通关体验，讨论了画面表现和剧情走向。",
+            )
+            for _ in range(5)
         ),
     ]
 
@@ -174,40 +157,15 @@ async def debug_render(
             mbti="ENFP",
             reason="总能精准接住每一个冷笑话，让群里充满快活的气息。",
         ),
-        UserTitle(
-            name="潜水员",
-            user_id="112233445",
-            title="深夜潜水员",
-            mbti="INFP",
-            reason="总是在凌晨三点出没，留下几句深奥的话语后消失。",
-        ),
-        UserTitle(
-            name="潜水员",
-            user_id="112233445",
-            title="深夜潜水员",
-            mbti="INFP",
-            reason="总是在凌晨三点出没，留下几句深奥的话语后消失。",
-        ),
-        UserTitle(
-            name="潜水员",
-            user_id="112233445",
-            title="深夜潜水员",
-            mbti="INFP",
-            reason="总是在凌晨三点出没，留下几句深奥的话语后消失。",
-        ),
-        UserTitle(
-            name="潜水员",
-            user_id="112233445",
-            title="深夜潜水员",
-            mbti="INFP",
-            reason="总是在凌晨三点出没，留下几句深奥的话语后消失。",
-        ),
-        UserTitle(
-            name="潜水员",
-            user_id="112233445",
-            title="深夜潜水员",
-            mbti="INFP",
-            reason="总是在凌晨三点出没，留下几句深奥的话语后消失。",
+        *(
+            UserTitle(
+                name="潜水员",
+                user_id="112233445",
+                title="深夜潜水员",
+                mbti="INFP",
+                reason="总是在凌晨三点出没，留下几句深奥的话语后消失。",
+            )
+            for _ in range(5)
         ),
     ]
 
@@ -224,35 +182,14 @@ async def debug_render(
             reason="经典的开发辩解",
             user_id="987654321",
         ),
-        GoldenQuote(
-            content="PHP是世界上最好的语言！",
-            sender="王五",
-            reason="引发了长达3小时的群聊大讨论",
-            user_id="112233445",
-        ),
-        GoldenQuote(
-            content="PHP是世界上最好的语言！",
-            sender="王五",
-            reason="引发了长达3小时的群聊大讨论",
-            user_id="112233445",
-        ),
-        GoldenQuote(
-            content="PHP是世界上最好的语言！",
-            sender="王五",
-            reason="引发了长达3小时的群聊大讨论",
-            user_id="112233445",
-        ),
-        GoldenQuote(
-            content="PHP是世界上最好的语言！",
-            sender="王五",
-            reason="引发了长达3小时的群聊大讨论",
-            user_id="112233445",
-        ),
-        GoldenQuote(
-            content="PHP是世界上最好的语言！",
-            sender="王五",
-            reason="引发了长达3小时的群聊大讨论",
-            user_id="112233445",
+        *(
+            GoldenQuote(
+                content="PHP是世界上最好的语言！",
+                sender="王五",
+                reason="引发了长达3小时的群聊大讨论",
+                user_id="112233445",
+            )
+            for _ in range(5)
         ),
     ]
 
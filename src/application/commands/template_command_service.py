@@ -3,67 +3,133 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
+from collections.abc import Sequence
 
 from astrbot.api.message_components import Image, Node, Nodes, Plain
 
+# 模板预览图文件名后缀
+_PREVIEW_SUFFIX = "-demo.jpg"
+
+# 模板预览序号
+_CIRCLE_NUMS = ("①", "②", "③", "④", "⑤", "⑥", "⑦", "⑧", "⑨", "⑩")
+_CIRCLE_NUMS_LEN = len(_CIRCLE_NUMS)
+
+
+def _scan_templates(base_dir: str) -> tuple[tuple[str, ...], frozenset[str]]:
+    """扫描模板目录，返回 (排序后的模板名称元组, 模板名称集合)。"""
+    try:
+        with os.scandir(base_dir) as entries:
+            names = [
+                entry.name
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+                and not entry.name.startswith("__")
+            ]
+    except FileNotFoundError:
+        names = []
+    names.sort()
+    return tuple(names), frozenset(names)
+
+
+def _scan_previews(assets_dir: str) -> dict[str, str]:
+    """一次扫描资源目录，返回 {模板名: 预览图路径}。"""
+    previews = {}
+    try:
+        with os.scandir(assets_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(_PREVIEW_SUFFIX) and entry.is_file():
+                    previews[entry.name[: -len(_PREVIEW_SUFFIX)]] = entry.path
+    except FileNotFoundError:
+        pass
+    return previews
+
+
+def _dir_mtime_ns(path: str) -> int:
+    """获取目录修改时间（纳秒），目录不存在时返回 -1。"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
 
 class TemplateCommandService:
     """封装模板命令的文件系统与消息构建逻辑。"""
 
-    _CIRCLE_NUMBERS = ["①", "②", "③", "④", "⑤", "⑥", "⑦", "⑧", "⑨", "⑩"]
-
     def __init__(self, plugin_root: str):
         self.plugin_root = plugin_root
+        # 插件目录在运行期不变，路径只需拼接一次
+        self._template_dir_candidates = (
+            os.path.join(
+                plugin_root, "src", "infrastructure", "reporting", "templates"
+            ),
+            os.path.join(plugin_root, "src", "reports", "templates"),
+        )
+        self._assets_dir = os.path.join(plugin_root, "assets")
+        self._template_base_dir: str | None = None
+        # 缓存以 (模板目录 mtime, 资源目录 mtime) 为键，目录变化时才重新扫描
+        self._templates_cache: tuple[tuple[int, int], tuple[str, ...]] | None = None
+        self._template_names: frozenset[str] = frozenset()
+        self._previews: dict[str, str] | None = None
+
+    def invalidate_cache(self) -> None:
+        """清空模板列表与预览图缓存。"""
+        self._templates_cache = None
+        self._template_names = frozenset()
+        self._previews = None
 
     def resolve_template_base_dir(self) -> str:
         """解析报告模板目录（兼容新旧目录结构）。"""
-        candidate_dirs = [
-            os.path.join(
-                self.plugin_root, "src", "infrastructure", "reporting", "templates"
-            ),
-            os.path.join(self.plugin_root, "src", "reports", "templates"),
-        ]
-        for candidate in candidate_dirs:
+        if self._template_base_dir is not None:
+            return self._template_base_dir
+
+        for candidate in self._template_dir_candidates:
             if os.path.isdir(candidate):
+                self._template_base_dir = candidate
                 return candidate
-        return candidate_dirs[0]
+        return self._template_dir_candidates[0]
 
     def resolve_template_preview_path(self, template_name: str) -> str | None:
         """解析模板预览图路径。"""
-        candidate_paths = [
-            os.path.join(self.plugin_root, "assets", f"{template_name}-demo.jpg"),
-        ]
-        for candidate in candidate_paths:
-            if os.path.exists(candidate):
-                return candidate
-        return None
+        if self._previews is not None:
+            return self._previews.get(template_name)
 
-    async def list_available_templates(self) -> list[str]:
-        """列出所有可用模板。"""
-        template_base_dir = self.resolve_template_base_dir()
+        candidate = os.path.join(self._assets_dir, f"{template_name}{_PREVIEW_SUFFIX}")
+        return candidate if os.path.exists(candidate) else None
+
+    def _scan_all(
+        self, template_base_dir: str
+    ) -> tuple[tuple[str, ...], frozenset[str], dict[str, str]]:
+        """同步扫描模板目录与预览图目录。"""
+        templates, names = _scan_templates(template_base_dir)
+        return templates, names, _scan_previews(self._assets_dir)
 
-        def _list_templates_sync() -> list[str]:
-            if os.path.exists(template_base_dir):
-                return sorted(
-                    [
-                        d
-                        for d in os.listdir(template_base_dir)
-                        if os.path.isdir(os.path.join(template_base_dir, d))
-                        and not d.startswith("__")
-                    ]
-                )
-            return []
-
-        return await asyncio.to_thread(_list_templates_sync)
-
-    async def template_exists(self, template_name: str) -> bool:
-        """检查模板目录是否存在。"""
-        template_dir = os.path.join(self.resolve_template_base_dir(), template_name)
-        return await asyncio.to_thread(os.path.exists, template_dir)
+    async def list_available_templates(self) -> tuple[str, ...]:
+        """列出所有可用模板（目录未变化时直接返回缓存）。"""
+        template_base_dir = self.resolve_template_base_dir()
+        cache_key = (
+            _dir_mtime_ns(template_base_dir),
+            _dir_mtime_ns(self._assets_dir),
+        )
+        cached = self._templates_cache
+        if cached and cached[0] == cache_key:
+            return cached[1]
+
+        templates, names, previews = await asyncio.to_thread(
+            self._scan_all, template_base_dir
+        )
+        self._templates_cache = (cache_key, templates)
+        self._template_names = names
+        self._previews = previews
+        return templates
+
+    def has_template(self, template_name: str) -> bool:
+        """基于最近一次扫描结果检查模板是否存在。"""
+        return template_name in self._template_names
 
     def parse_template_input(
-        self, template_input: str, available_templates: list[str]
+        self, template_input: str, available_templates: Sequence[str]
     ) -> tuple[str | None, str | None]:
         """解析模板输入（支持模板名或序号）。"""
         normalized_input = (template_input or "").strip()
@@ -80,6 +146,10 @@ class TemplateCommandService:
                 f"❌ 无效的序号 '{normalized_input}'，有效范围: 1-{len(available_templates)}",
             )
 
+        # 精确匹配是最常见的路径，直接返回，无需构建大小写映射
+        if normalized_input in available_templates:
+            return normalized_input, None
+
         # 兼容大小写输入（例如 /设置模板 Simple），并避免大小写冲突吞模板
         lower_to_names: dict[str, list[str]] = {}
         for name in available_templates:
@@ -89,37 +159,34 @@ class TemplateCommandService:
         normalized_lower = normalized_input.lower()
         has_case_collision = any(len(names) > 1 for names in lower_to_names.values())
 
-        if not has_case_collision:
-            if normalized_lower in lower_to_names:
-                return lower_to_names[normalized_lower][0], None
-        elif normalized_input in available_templates:
-            # 有冲突时只做区分大小写精确匹配，避免不可达模板
-            return normalized_input, None
+        # 有冲突时只接受上面的区分大小写精确匹配，避免不可达模板
+        if not has_case_collision and normalized_lower in lower_to_names:
+            return lower_to_names[normalized_lower][0], None
 
         return normalized_input, None
 
     def build_template_preview_nodes(
         self,
-        available_templates: list[str],
+        available_templates: Sequence[str],
         current_template: str,
         bot_id: str,
     ) -> Nodes:
         """构建模板预览的合并消息节点。"""
         node_list = []
+        # 所有节点共用同一发送者，预先绑定 uin
+        make_node = functools.partial(Node, uin=bot_id)
 
         header_content = [
             Plain(
                 f"🎨 可用报告模板列表\n📌 当前使用: {current_template}\n💡 使用 /设置模板 [序号] 切换"
             )
         ]
-        node_list.append(Node(uin=bot_id, name="模板预览", content=header_content))
+        node_list.append(make_node(name="模板预览", content=header_content))
 
         for index, template_name in enumerate(available_templates):
             current_mark = " ✅" if template_name == current_template else ""
             num_label = (
-                self._CIRCLE_NUMBERS[index]
-                if index < len(self._CIRCLE_NUMBERS)
-                else f"({index + 1})"
+                _CIRCLE_NUMS[index] if index < _CIRCLE_NUMS_LEN else f"({index + 1})"
             )
 
             node_content = [Plain(f"{num_label} {template_name}{current_mark}")]
@@ -127,6 +194,6 @@ class TemplateCommandService:
             if preview_image_path:
                 node_content.append(Image.fromFileSystem(preview_image_path))
 
-            node_list.append(Node(uin=bot_id, name=template_name, content=node_content))
+            node_list.append(make_node(name=template_name, content=node_content))
 
         return Nodes(node_list)
@@ -16,6 +16,7 @@ from ...domain.repositories.analysis_repository import IAnalysisProvider
 from ...domain.repositories.report_repository import IReportGenerator
 from ...domain.services.analysis_domain_service import AnalysisDomainService
 from ...domain.services.incremental_merge_service import IncrementalMergeService
+from ...domain.services.message_cleaner_service import MessageCleanerService
 from ...domain.services.statistics_service import StatisticsService
 from ...domain.value_objects.unified_message import UnifiedMessage
 from ...infrastructure.persistence.incremental_store import IncrementalStore
@@ -70,10 +71,14 @@ class AnalysisApplicationService:
         if not adapter:
             raise ValueError(f"未找到平台 {platform_id} 的适配器")
 
-        # 2. 拉取消息
-        days = self.config_manager.get_analysis_days()
-        max_count = self.config_manager.get_max_messages()
+        # 本次用例所需配置一次性读取为局部变量
+        config = self.config_manager
+        days = config.get_analysis_days()
+        max_count = config.get_max_messages()
+        bot_self_ids = config.get_bot_self_ids()
+        threshold = config.get_min_messages_threshold()
 
+        # 2. 拉取消息
         raw_messages = await adapter.fetch_messages(
             group_id=group_id, days=days, max_count=max_count
         )
@@ -83,10 +88,7 @@ class AnalysisApplicationService:
             return {"success": False, "reason": "no_messages"}
 
         # 3. 清理消息 (Filter commands, bot messages, noise)
-        from ...domain.services.message_cleaner_service import MessageCleanerService
-
         cleaner = MessageCleanerService()
-        bot_self_ids = self.config_manager.get_bot_self_ids()
 
         # 对于自动任务，强制过滤指令；对于手动任务，也建议过滤以保持报告纯净
         unified_messages = cleaner.clean_messages(
@@ -94,7 +96,6 @@ class AnalysisApplicationService:
         )
 
         # 4. 检查最小消息阈值 (在清理后进行)
-        threshold = self.config_manager.get_min_messages_threshold()
         if len(unified_messages) < threshold and not manual:
             logger.info(
                 f"群 {group_id} 有效消息数 ({len(unified_messages)}) 未达到自动分析阈值 ({threshold})"
@@ -102,12 +103,56 @@ class AnalysisApplicationService:
             return {"success": False, "reason": "below_threshold"}
 
         # 5. 基础统计 (Domain Service)
-        statistics = await asyncio.to_thread(
-            self.statistics_service.calculate_group_statistics, unified_messages
+        # 基础统计与用户分析 + LLM 语义分析互不依赖，并发执行以重叠 CPU 与网络等待
+        statistics, semantic = await asyncio.gather(
+            asyncio.to_thread(
+                self.statistics_service.calculate_group_statistics, unified_messages
+            ),
+            self._run_semantic_analysis(
+                group_id, platform_id, unified_messages, bot_self_ids
+            ),
         )
+        user_activity, topics, user_titles, golden_quotes, total_token_usage = semantic
 
+        # 回填结果
+        statistics.golden_quotes = golden_quotes
+        statistics.token_usage = total_token_usage
+
+        analysis_result = {
+            "statistics": statistics,
+            "topics": topics,
+            "user_titles": user_titles,
+            "user_analysis": user_activity,
+        }
+
+        # 6. 持久化摘要 (Persistence)
+        await self.history_manager.save_analysis(group_id, analysis_result)
+
+        # 7. 生成报告并发送 (应用层编排发送动作)
+        # 这里由调用方处理发送，本服务只返回分析结果和可能的视觉产物
+        return {
+            "success": True,
+            "analysis_result": analysis_result,
+            "messages_count": len(unified_messages),
+            "adapter": adapter,
+        }
+
+    async def _run_semantic_analysis(
+        self,
+        group_id: str,
+        platform_id: str | None,
+        unified_messages: list,
+        bot_self_ids: list,
+    ) -> tuple[dict, list, list, list, TokenUsage]:
+        """
+        执行用户分析与 LLM 语义分析。
+
+        与基础统计相互独立，由 execute_daily_analysis 并发调度。
+
+        Returns:
+            (用户活跃度, 话题, 用户称号, 金句, Token 使用统计)
+        """
         # 4. 用户分析 (Domain Service)
-        bot_self_ids = self.config_manager.get_bot_self_ids()
         user_activity = await asyncio.to_thread(
             self.analysis_domain_service.analyze_user_activity,
             unified_messages,
@@ -125,10 +170,8 @@ class AnalysisApplicationService:
         user_title_enabled = self.config_manager.get_user_title_analysis_enabled()
         golden_quote_enabled = self.config_manager.get_golden_quote_analysis_enabled()
 
-        topics = []
-        user_titles = []
-        golden_quotes = []
-        total_token_usage = TokenUsage()
+        if not (topic_enabled or user_title_enabled or golden_quote_enabled):
+            return user_activity, [], [], [], TokenUsage()
 
         # Note: LLMAnalyzer 目前可能只接收 legacy 格式或特定的 UnifiedMessage 适配
         # 暂时转换回 legacy 格式以确保稳定性，直到 LLMAnalyzer 被重构
@@ -140,44 +183,21 @@ class AnalysisApplicationService:
             f"{platform_id}:GroupMessage:{group_id}" if platform_id else group_id
         )
 
-        if topic_enabled or user_title_enabled or golden_quote_enabled:
-            (
-                topics,
-                user_titles,
-                golden_quotes,
-                total_token_usage,
-            ) = await self.llm_analyzer.analyze_all_concurrent(
-                legacy_messages,
-                user_activity,
-                umo=unified_msg_origin,
-                top_users=top_users,
-                topic_enabled=topic_enabled,
-                user_title_enabled=user_title_enabled,
-                golden_quote_enabled=golden_quote_enabled,
-            )
-
-        # 回填结果
-        statistics.golden_quotes = golden_quotes
-        statistics.token_usage = total_token_usage
-
-        analysis_result = {
-            "statistics": statistics,
-            "topics": topics,
-            "user_titles": user_titles,
-            "user_analysis": user_activity,
-        }
-
-        # 6. 持久化摘要 (Persistence)
-        await self.history_manager.save_analysis(group_id, analysis_result)
-
-        # 7. 生成报告并发送 (应用层编排发送动作)
-        # 这里由调用方处理发送，本服务只返回分析结果和可能的视觉产物
-        return {
-            "success": True,
-            "analysis_result": analysis_result,
-            "messages_count": len(unified_messages),
-            "adapter": adapter,
-        }
+        (
+            topics,
+            user_titles,
+            golden_quotes,
+            total_token_usage,
+        ) = await self.llm_analyzer.analyze_all_concurrent(
+            legacy_messages,
+            user_activity,
+            umo=unified_msg_origin,
+            top_users=top_users,
+            topic_enabled=topic_enabled,
+            user_title_enabled=user_title_enabled,
+            golden_quote_enabled=golden_quote_enabled,
+        )
+        return user_activity, topics, user_titles, golden_quotes, total_token_usage
 
     # ----------------------------------------------------------------
     # 增量分析用例
@@ -225,6 +245,7 @@ class AnalysisApplicationService:
         # 2. 拉取消息（使用增量配置的消息数量上限）
         days = self.config_manager.get_analysis_days()
         max_count = self.config_manager.get_incremental_max_messages()
+        bot_self_ids = self.config_manager.get_bot_self_ids()
 
         raw_messages = await adapter.fetch_messages(
             group_id=group_id, days=days, max_count=max_count
@@ -235,10 +256,7 @@ class AnalysisApplicationService:
             return {"success": False, "reason": "no_messages"}
 
         # 3. 清理消息
-        from ...domain.services.message_cleaner_service import MessageCleanerService
-
         cleaner = MessageCleanerService()
-        bot_self_ids = self.config_manager.get_bot_self_ids()
         unified_messages = cleaner.clean_messages(
             raw_messages, bot_self_ids=bot_self_ids, filter_commands=True
         )
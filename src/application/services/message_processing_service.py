@@ -1,12 +1,57 @@
+import asyncio
 import re
-from collections import Counter
+import time
+from collections import OrderedDict
+from functools import lru_cache
 
 from astrbot.api.event import AstrMessageEvent
 from astrbot.api.star import Context
 
 from ...infrastructure.persistence.telegram_group_registry import TelegramGroupRegistry
+from ...shared.constants import CACHE_TTL_MEDIUM
 from ...utils.logger import logger
 
+# 写库队列的最大长度，超出时 process_message 等待写库协程腾出空位
+_INSERT_QUEUE_MAXSIZE = 1000
+
+# 发送者名称缓存上限
+_SENDER_NAME_CACHE_SIZE = 10000
+
+# 视为占位值的发送者名称（小写）
+_PLACEHOLDER_NAMES = frozenset({"unknown", "none", "null", "nil", "undefined"})
+
+# 消息段类型 -> 归一化类型（兼容组件类名与 OneBot 原始类型）
+_SEGMENT_KINDS = {
+    "Plain": "plain",
+    "text": "plain",
+    "Image": "image",
+    "image": "image",
+    "At": "at",
+    "at": "at",
+}
+
+# 连续空白
+_MULTI_WS_RE = re.compile(r"\s{2,}")
+
+
+@lru_cache(maxsize=4096)
+def _mention_pattern(mention: str) -> re.Pattern[str]:
+    """获取（并缓存）匹配 @mention 的正则"""
+    return re.compile(rf"(?<!\w)@{re.escape(mention)}(?!\w)")
+
+
+# 提及数达到该值时改用单个多选正则一次扫描全文
+_MULTI_MENTION_THRESHOLD = 3
+
+
+@lru_cache(maxsize=1024)
+def _multi_mention_pattern(mentions: tuple[str, ...]) -> re.Pattern[str]:
+    """获取（并缓存）同时匹配多个 @mention 的正则（长名称优先）"""
+    alternation = "|".join(
+        re.escape(mention) for mention in sorted(mentions, key=len, reverse=True)
+    )
+    return re.compile(rf"(?<!\w)@({alternation})(?!\w)")
+
 
 class MessageProcessingService:
     """
@@ -22,6 +67,18 @@ class MessageProcessingService:
     def __init__(self, context: Context, telegram_registry: TelegramGroupRegistry):
         self.context = context
         self.telegram_registry = telegram_registry
+        # (platform_id, sender_id) -> (名称, 写入时间)；短 TTL 以便昵称变更能及时生效
+        self._sender_name_cache: OrderedDict[tuple[str, str], tuple[str, float]] = (
+            OrderedDict()
+        )
+        # 消息写库队列：由单个后台协程按入队顺序写入，事件处理无需等待数据库；
+        # 队列有上限，数据库卡住时入队方会等待，避免内存无限增长
+        self._insert_queue: asyncio.Queue[dict] = asyncio.Queue(
+            maxsize=_INSERT_QUEUE_MAXSIZE
+        )
+        self._insert_task: asyncio.Task | None = None
+        # close() 之后不再接受新的写库请求，也不会重新拉起写库协程
+        self._closed = False
 
     async def process_message(self, event: AstrMessageEvent) -> None:
         """
@@ -45,14 +102,14 @@ class MessageProcessingService:
             raise ValueError(f"群 {group_id}: 无法获取发送者 ID，拒绝存储消息")
         sender_id = str(sender_id)
 
-        # 3. 获取发送者名称（昵称优先，必要时回退）
-        sender_name = self._resolve_sender_name(event, sender_id)
-
-        # 4. 获取平台 ID（必需）
+        # 3. 获取平台 ID（必需）
         platform_id = event.get_platform_id()
         if not platform_id:
             raise ValueError(f"群 {group_id}: 无法获取平台 ID，拒绝存储消息")
 
+        # 4. 获取发送者名称（昵称优先，必要时回退）
+        sender_name = self._get_sender_name(event, platform_id, sender_id)
+
         # 5. 提取消息内容
         message_parts = self._extract_message_parts(event)
         if not message_parts:
@@ -66,13 +123,15 @@ class MessageProcessingService:
         msg_obj = getattr(event, "message_obj", None)
         event_message_id = str(getattr(msg_obj, "message_id", "") or "")
 
-        # 7. 存储到数据库
-        await self.context.message_history_manager.insert(
-            platform_id=platform_id,
-            user_id=group_id,
-            content={"type": "user", "message": message_parts},
-            sender_id=sender_id,
-            sender_name=sender_name,
+        # 7. 加入写库队列（由后台协程写入数据库）
+        await self._enqueue_insert(
+            {
+                "platform_id": platform_id,
+                "user_id": group_id,
+                "content": {"type": "user", "message": message_parts},
+                "sender_id": sender_id,
+                "sender_name": sender_name,
+            }
         )
 
         # Telegram: 记录已见群/话题
@@ -87,13 +146,70 @@ class MessageProcessingService:
                 )
             except Exception as e:
                 logger.warning(
-                    "[TGRegistry] Upsert failed: "
-                    f"platform_id={platform_id} group_id={group_id} error={e}"
+                    "[TGRegistry] Upsert failed: platform_id=%s group_id=%s error=%s",
+                    platform_id,
+                    group_id,
+                    e,
                 )
 
-        logger.debug(
-            f"[{platform_id}] 已缓存群 {group_id} 的消息 (发送者: {sender_name})"
-        )
+    async def _enqueue_insert(self, payload: dict) -> None:
+        """将待写入的消息放入队列，写库协程按需懒启动；队列满时等待空位"""
+        if self._closed:
+            logger.warning(
+                "[MessageStore] 服务已关闭，丢弃群 %s 的消息", payload["user_id"]
+            )
+            return
+        if self._insert_task is None or self._insert_task.done():
+            self._insert_task = asyncio.create_task(self._insert_worker())
+        await self._insert_queue.put(payload)
+
+    async def _insert_worker(self) -> None:
+        """写库协程：按入队顺序逐条写入，保持消息顺序"""
+        queue = self._insert_queue
+        insert = self.context.message_history_manager.insert
+        while True:
+            payload = await queue.get()
+            try:
+                await insert(**payload)
+                # 每条消息都会经过此处，使用惰性格式化，未开启 DEBUG 时不拼接字符串
+                logger.debug(
+                    "[%s] 已缓存群 %s 的消息 (发送者: %s)",
+                    payload["platform_id"],
+                    payload["user_id"],
+                    payload["sender_name"],
+                )
+            except Exception as e:
+                logger.error(
+                    "[MessageStore] 群 %s 消息写入失败: %s", payload["user_id"], e
+                )
+            finally:
+                queue.task_done()
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """
+        等待队列中的消息全部写入后停止写库协程（插件卸载时调用）。
+
+        写库卡住时最多等待 timeout 秒，超时后放弃剩余消息，避免阻塞插件卸载。
+        """
+        self._closed = True
+        task = self._insert_task
+        if task is None:
+            return
+        if not task.done():
+            try:
+                await asyncio.wait_for(self._insert_queue.join(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "[MessageStore] 写入超时 (%s 秒)，放弃队列中剩余的 %s 条消息",
+                    timeout,
+                    self._insert_queue.qsize(),
+                )
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._insert_task = None
 
     def _get_group_id_from_event(self, event: AstrMessageEvent) -> str | None:
         """从消息事件中安全获取群组 ID"""
@@ -103,6 +219,25 @@ class MessageProcessingService:
         except Exception:
             return None
 
+    def _get_sender_name(
+        self, event: AstrMessageEvent, platform_id: str, sender_id: str
+    ) -> str:
+        """获取发送者展示名（带 TTL 缓存，活跃用户无需每条消息重复解析）"""
+        key = (platform_id, sender_id)
+        now = time.monotonic()
+        cache = self._sender_name_cache
+
+        cached = cache.get(key)
+        if cached is not None and now - cached[1] < CACHE_TTL_MEDIUM:
+            return cached[0]
+
+        sender_name = self._resolve_sender_name(event, sender_id)
+        cache[key] = (sender_name, now)
+        cache.move_to_end(key)
+        if len(cache) > _SENDER_NAME_CACHE_SIZE:
+            cache.popitem(last=False)
+        return sender_name
+
     def _resolve_sender_name(self, event: AstrMessageEvent, sender_id: str) -> str:
         """解析发送者展示名"""
         platform_name = str(event.get_platform_name() or "").lower()
@@ -141,9 +276,10 @@ class MessageProcessingService:
                 ]
             )
 
+        stripped_id = sender_id.strip()
         for candidate in candidates:
             name = str(candidate or "").strip()
-            if not self._is_placeholder_sender_name(name, sender_id):
+            if name and not self._is_placeholder_sender_name(name, stripped_id):
                 return name
 
         return sender_id
@@ -153,112 +289,121 @@ class MessageProcessingService:
         message_parts = []
         message = event.message_obj
 
-        # 收集 @ 标记
-        pending_mentions: Counter[str] = Counter()
-        if message and hasattr(message, "message"):
-            for seg in message.message:
-                if not hasattr(seg, "type"):
-                    continue
-                if seg.type not in ("At", "at"):
-                    continue
+        # 单次遍历：收集 @ 标记的同时构建消息段，文本段先记下位置，
+        # 待全部 @ 收集完成后再统一清理其中的提及文本
+        pending_mentions: dict[str, int] = {}
+        plain_indexes: list[int] = []
+        segments = getattr(message, "message", None) if message else None
+        for seg in segments or ():
+            kind = _SEGMENT_KINDS.get(getattr(seg, "type", None))
+            if kind is None:
+                continue
+            data = getattr(seg, "data", None)
+
+            if kind == "plain":
+                text = getattr(seg, "text", None)
+                if text is None and data is not None:
+                    text = data.get("text")
+                if text:
+                    plain_indexes.append(len(message_parts))
+                    message_parts.append({"type": "plain", "text": text})
+
+            elif kind == "image":
+                url = getattr(seg, "url", None) or (
+                    data.get("url") if data is not None else None
+                )
+                if url:
+                    message_parts.append({"type": "image", "url": url})
 
+            else:
                 target = getattr(seg, "target", None) or getattr(seg, "qq", None)
-                if target is None and hasattr(seg, "data"):
-                    target = seg.data.get("qq") or seg.data.get("target")
+                if target is None and data is not None:
+                    target = data.get("qq") or data.get("target")
+                name = str(getattr(seg, "name", "") or "")
 
                 target_str = str(target or "").strip()
                 if target_str:
-                    pending_mentions[target_str] += 1
-
-                display_name = str(getattr(seg, "name", "") or "").strip()
+                    pending_mentions[target_str] = (
+                        pending_mentions.get(target_str, 0) + 1
+                    )
+                display_name = name.strip()
                 if display_name and display_name != target_str:
-                    pending_mentions[display_name] += 1
-
-        if message and hasattr(message, "message"):
-            for seg in message.message:
-                if not hasattr(seg, "type"):
-                    continue
-
-                seg_type = seg.type
-                if seg_type in ("Plain", "text"):
-                    text = getattr(seg, "text", None)
-                    if text is None and hasattr(seg, "data"):
-                        text = seg.data.get("text")
-                    if text:
-                        text = self._strip_known_mentions(text, pending_mentions)
-                        message_parts.append({"type": "plain", "text": text})
-
-                elif seg_type in ("Image", "image"):
-                    url = getattr(seg, "url", None) or (
-                        seg.data.get("url") if hasattr(seg, "data") else None
+                    pending_mentions[display_name] = (
+                        pending_mentions.get(display_name, 0) + 1
+                    )
+
+                if target:
+                    message_parts.append(
+                        {"type": "at", "target_id": str(target), "name": name}
                     )
-                    if url:
-                        message_parts.append({"type": "image", "url": url})
-
-                elif seg_type in ("At", "at"):
-                    target = getattr(seg, "target", None) or getattr(seg, "qq", None)
-                    if target is None and hasattr(seg, "data"):
-                        target = seg.data.get("qq") or seg.data.get("target")
-                    if target:
-                        message_parts.append(
-                            {
-                                "type": "at",
-                                "target_id": str(target),
-                                "name": str(getattr(seg, "name", "") or ""),
-                            }
-                        )
-
-        if not message_parts and event.message_str:
-            message_parts.append({"type": "plain", "text": event.message_str})
-
-        # 清理空文本段
-        message_parts = [
-            part
-            for part in message_parts
-            if not (
-                part.get("type") == "plain" and not str(part.get("text", "")).strip()
-            )
-        ]
+
+        # 清理提及后顺带记录是否出现空文本段，避免再完整遍历一次
+        has_empty_text = False
+        for index in plain_indexes:
+            part = message_parts[index]
+            text = self._strip_known_mentions(part["text"], pending_mentions)
+            part["text"] = text
+            if not text:
+                has_empty_text = True
+
+        message_str = event.message_str
+        if not message_parts and message_str and str(message_str).strip():
+            message_parts.append({"type": "plain", "text": message_str})
+
+        if has_empty_text:
+            message_parts = [
+                part
+                for part in message_parts
+                if part["type"] != "plain" or part["text"]
+            ]
 
         return message_parts
 
     @staticmethod
-    def _strip_known_mentions(text: str, pending_mentions: Counter[str]) -> str:
+    def _strip_known_mentions(text: str, pending_mentions: dict[str, int]) -> str:
         """从文本中移除已识别的 @ 提及"""
         cleaned = str(text)
         if not cleaned or not pending_mentions:
             return cleaned.strip()
 
-        for mention, remaining in list(pending_mentions.items()):
-            if not mention or remaining <= 0:
-                continue
+        # 只统计仍有剩余次数的提及；计数归零的键可能留在字典中，不应计入
+        mentions = [m for m, count in pending_mentions.items() if m and count > 0]
 
-            pattern = re.compile(rf"(?<!\w)@{re.escape(mention)}(?!\w)")
-            removed = 0
-            while removed < remaining:
-                cleaned, subn = pattern.subn("", cleaned, count=1)
-                if subn == 0:
-                    break
-                removed += 1
+        if len(mentions) >= _MULTI_MENTION_THRESHOLD:
 
-            if removed > 0:
-                pending_mentions[mention] -= removed
+            def _remove(match: re.Match[str]) -> str:
+                mention = match.group(1)
+                if pending_mentions[mention] <= 0:
+                    return match.group(0)
+                pending_mentions[mention] -= 1
+                return ""
+
+            pattern = _multi_mention_pattern(tuple(sorted(mentions)))
+            cleaned = pattern.sub(_remove, cleaned)
+            for mention in mentions:
                 if pending_mentions[mention] <= 0:
                     pending_mentions.pop(mention, None)
+            return _MULTI_WS_RE.sub(" ", cleaned).strip()
+
+        # 只递减计数不删除键
+        for mention in mentions:
+            remaining = pending_mentions[mention]
+            cleaned, removed = _mention_pattern(mention).subn(
+                "", cleaned, count=remaining
+            )
+            if removed > 0:
+                pending_mentions[mention] = remaining - removed
 
-        return re.sub(r"\s{2,}", " ", cleaned).strip()
+        return _MULTI_WS_RE.sub(" ", cleaned).strip()
 
     @staticmethod
-    def _is_placeholder_sender_name(name: str | None, sender_id: str) -> bool:
-        """判断 sender_name 是否为占位值"""
+    def _is_placeholder_sender_name(name: str, sender_id: str) -> bool:
+        """判断 sender_name 是否为占位值（name 与 sender_id 均需已去除首尾空白）"""
         if not name:
             return True
-        normalized = str(name).strip()
-        if not normalized:
-            return True
-        if normalized.lower() in {"unknown", "none", "null", "nil", "undefined"}:
+        if name.lower() in _PLACEHOLDER_NAMES:
             return True
-        return normalized == str(sender_id).strip()
+        return name == sender_id
 
     @staticmethod
     def _is_telegram_event(event: AstrMessageEvent, platform_id: str) -> bool:
@@ -1,12 +1,13 @@
 """
 数据模型定义
 包含所有分析相关的数据结构
+（LLM 分析结果按条目批量创建，使用 slots 减少每个实例的内存占用）
 """
 
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class SummaryTopic:
     """话题总结数据结构"""
 
@@ -18,7 +19,7 @@ class SummaryTopic:
     )  # 贡献者ID列表 (用于显示头像)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserTitle:
     """用户称号数据结构"""
 
@@ -29,7 +30,7 @@ class UserTitle:
     reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GoldenQuote:
     """群聊金句数据结构"""
 
@@ -39,7 +40,7 @@ class GoldenQuote:
     user_id: str = ""  # 原 qq 字段
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenUsage:
     """Token使用统计"""
 
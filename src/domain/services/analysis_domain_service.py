@@ -21,6 +21,11 @@ class AnalysisDomainService:
         r"[\U0001F000-\U0001F9FF]|[\U00002600-\U000026FF]|[\U00002700-\U000027BF]"
     )
 
+    # 两类表情合并为一个预编译模式，每段文本只需扫描一次
+    EMOJI_PATTERN = re.compile(
+        f"{DISCORD_CUSTOM_EMOJI_PATTERN}|{UNICODE_EMOJI_PATTERN}"
+    )
+
     def analyze_user_activity(
         self, messages: list[UnifiedMessage], bot_self_ids: list[str] = None
     ) -> dict[str, dict]:
@@ -64,10 +69,7 @@ class AnalysisDomainService:
 
                     # 统计文本中的表情 (Discord/Unicode)
                     user_stats[user_id]["emoji_count"] += len(
-                        re.findall(self.DISCORD_CUSTOM_EMOJI_PATTERN, text)
-                    )
-                    user_stats[user_id]["emoji_count"] += len(
-                        re.findall(self.UNICODE_EMOJI_PATTERN, text)
+                        self.EMOJI_PATTERN.findall(text)
                     )
 
                 elif content.type == MessageContentType.EMOJI:
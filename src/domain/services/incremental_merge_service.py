@@ -7,6 +7,7 @@
 
 核心职责：
 - merge_batches: 将多个 IncrementalBatch 合并为一个 IncrementalState（滑动窗口聚合）
+- new_state / fold_batch: 逐批折叠合并，配合流式读取批次
 - IncrementalState → GroupStatistics（含 ActivityVisualization、EmojiStatistics）
 - IncrementalState → list[SummaryTopic]
 - IncrementalState → list[GoldenQuote]
@@ -34,6 +35,25 @@ class IncrementalMergeService:
     确保增量模式下生成的最终报告与传统单次分析报告格式完全一致。
     """
 
+    def new_state(self, window_start: float, window_end: float) -> IncrementalState:
+        """
+        创建空的聚合状态，供 fold_batch 逐批折叠。
+
+        Args:
+            window_start: 窗口起始时间戳（epoch）
+            window_end: 窗口结束时间戳（epoch）
+
+        Returns:
+            IncrementalState: 尚未合并任何批次的聚合视图
+        """
+        return IncrementalState(
+            window_start=window_start,
+            window_end=window_end,
+            total_analysis_count=0,
+            created_at=window_start,
+            updated_at=time.time(),
+        )
+
     def merge_batches(
         self,
         batches: list[IncrementalBatch],
@@ -54,122 +74,9 @@ class IncrementalMergeService:
         Returns:
             IncrementalState: 合并后的聚合视图
         """
-        state = IncrementalState(
-            group_id=batches[0].group_id if batches else "",
-            window_start=window_start,
-            window_end=window_end,
-            total_analysis_count=len(batches),
-            created_at=window_start,
-            updated_at=time.time(),
-        )
-
+        state = self.new_state(window_start, window_end)
         for batch in batches:
-            # 累加消息和字符计数
-            state.total_message_count += batch.messages_count
-            state.total_character_count += batch.characters_count
-
-            # 合并每小时消息分布（按键累加）
-            for hour_key, count in batch.hourly_msg_counts.items():
-                hour_str = str(hour_key)
-                state.hourly_message_counts[hour_str] = (
-                    state.hourly_message_counts.get(hour_str, 0) + count
-                )
-
-            # 合并每小时字符分布
-            for hour_key, count in batch.hourly_char_counts.items():
-                hour_str = str(hour_key)
-                state.hourly_character_counts[hour_str] = (
-                    state.hourly_character_counts.get(hour_str, 0) + count
-                )
-
-            # 合并用户统计（按用户累加消息数、字符数等）
-            for user_id, stats in batch.user_stats.items():
-                if user_id not in state.user_activities:
-                    state.user_activities[user_id] = {
-                        "nickname": stats.get("nickname", stats.get("name", user_id)),
-                        "message_count": 0,
-                        "char_count": 0,
-                        "emoji_count": 0,
-                        "reply_count": 0,
-                        "hours": {},
-                        "last_message_time": 0,
-                    }
-                existing = state.user_activities[user_id]
-                existing["message_count"] += stats.get("message_count", 0)
-                existing["char_count"] += stats.get("char_count", 0)
-                existing["emoji_count"] += stats.get("emoji_count", 0)
-                existing["reply_count"] += stats.get("reply_count", 0)
-
-                # 合并每小时统计
-                # 兼容旧版本 (active_hours 是 list) 和新版本 (hours 是 dict)
-                batch_hours = stats.get("hours", {})
-                if isinstance(batch_hours, dict):
-                    # 现代 schema: hours 是 dict {hour: count}
-                    for h_str, h_count in batch_hours.items():
-                        h_int = int(h_str)
-                        existing["hours"][h_int] = (
-                            existing["hours"].get(h_int, 0) + h_count
-                        )
-                else:
-                    # 兼容旧 schema: 只有 active_hours (list)
-                    active_hours = stats.get("active_hours", [])
-                    for h in active_hours:
-                        h_int = int(h)
-                        existing["hours"][h_int] = existing["hours"].get(h_int, 0) + 1
-
-                # 取最后消息时间的较大值
-                batch_last = stats.get("last_message_time", 0)
-                if batch_last > existing.get("last_message_time", 0):
-                    existing["last_message_time"] = batch_last
-
-                # 更新昵称（使用最新批次的昵称）
-                nickname = stats.get("nickname", stats.get("name", ""))
-                if nickname:
-                    existing["nickname"] = nickname
-
-            # 合并表情统计（按键累加）
-            for emoji_key, count in batch.emoji_stats.items():
-                current_val = state.emoji_counts.get(emoji_key, 0)
-                if isinstance(count, dict):
-                    # 如果是嵌套字典（如 face_details），则合并内部计数
-                    if not isinstance(current_val, dict):
-                        current_val = {}
-
-                    for sub_key, sub_count in count.items():
-                        current_val[sub_key] = current_val.get(sub_key, 0) + sub_count
-
-                    state.emoji_counts[emoji_key] = current_val
-                else:
-                    # 如果是数值，直接累加
-                    if isinstance(current_val, dict):
-                        # 异常情况：现有值是字典但新值是数字，通常不应发生，除非 schema 变更
-                        # 此时保留字典，忽略数字或记录错误，这里选择保留字典
-                        continue
-
-                    state.emoji_counts[emoji_key] = current_val + count
-
-            # 合并话题（去重）
-            for topic in batch.topics:
-                if not IncrementalState.is_duplicate_topic(topic, state.topics):
-                    state.topics.append(topic)
-
-            # 合并金句（去重）
-            for quote in batch.golden_quotes:
-                if not IncrementalState.is_duplicate_quote(quote, state.golden_quotes):
-                    state.golden_quotes.append(quote)
-
-            # 累加 token 消耗
-            for token_key in ("prompt_tokens", "completion_tokens", "total_tokens"):
-                state.total_token_usage[token_key] = state.total_token_usage.get(
-                    token_key, 0
-                ) + batch.token_usage.get(token_key, 0)
-
-            # 合并参与者 ID（取并集）
-            state.all_participant_ids.update(batch.participant_ids)
-
-            # 记录最后分析消息时间戳（取最大值）
-            if batch.last_message_timestamp > state.last_analyzed_message_timestamp:
-                state.last_analyzed_message_timestamp = batch.last_message_timestamp
+            self.fold_batch(state, batch)
 
         logger.info(
             f"合并批次完成: 群={state.group_id}, "
@@ -181,6 +88,126 @@ class IncrementalMergeService:
 
         return state
 
+    def fold_batch(self, state: IncrementalState, batch: IncrementalBatch) -> None:
+        """
+        将单个批次折叠进聚合状态（原地修改）。
+
+        与 merge_batches 的结果一致，但无需一次性持有全部批次，
+        可配合 IncrementalStore.iter_batches 流式合并。
+
+        Args:
+            state: 由 new_state 创建的聚合状态
+            batch: 待合并的批次（应按时间升序依次传入）
+        """
+        if not state.group_id:
+            state.group_id = batch.group_id
+        state.total_analysis_count += 1
+
+        # 累加消息和字符计数
+        state.total_message_count += batch.messages_count
+        state.total_character_count += batch.characters_count
+
+        # 合并每小时消息分布（按键累加）
+        for hour_key, count in batch.hourly_msg_counts.items():
+            hour_str = str(hour_key)
+            state.hourly_message_counts[hour_str] = (
+                state.hourly_message_counts.get(hour_str, 0) + count
+            )
+
+        # 合并每小时字符分布
+        for hour_key, count in batch.hourly_char_counts.items():
+            hour_str = str(hour_key)
+            state.hourly_character_counts[hour_str] = (
+                state.hourly_character_counts.get(hour_str, 0) + count
+            )
+
+        # 合并用户统计（按用户累加消息数、字符数等）
+        for user_id, stats in batch.user_stats.items():
+            if user_id not in state.user_activities:
+                state.user_activities[user_id] = {
+                    "nickname": stats.get("nickname", stats.get("name", user_id)),
+                    "message_count": 0,
+                    "char_count": 0,
+                    "emoji_count": 0,
+                    "reply_count": 0,
+                    "hours": {},
+                    "last_message_time": 0,
+                }
+            existing = state.user_activities[user_id]
+            existing["message_count"] += stats.get("message_count", 0)
+            existing["char_count"] += stats.get("char_count", 0)
+            existing["emoji_count"] += stats.get("emoji_count", 0)
+            existing["reply_count"] += stats.get("reply_count", 0)
+
+            # 合并每小时统计
+            # 兼容旧版本 (active_hours 是 list) 和新版本 (hours 是 dict)
+            batch_hours = stats.get("hours", {})
+            if isinstance(batch_hours, dict):
+                # 现代 schema: hours 是 dict {hour: count}
+                for h_str, h_count in batch_hours.items():
+                    h_int = int(h_str)
+                    existing["hours"][h_int] = existing["hours"].get(h_int, 0) + h_count
+            else:
+                # 兼容旧 schema: 只有 active_hours (list)
+                active_hours = stats.get("active_hours", [])
+                for h in active_hours:
+                    h_int = int(h)
+                    existing["hours"][h_int] = existing["hours"].get(h_int, 0) + 1
+
+            # 取最后消息时间的较大值
+            batch_last = stats.get("last_message_time", 0)
+            if batch_last > existing.get("last_message_time", 0):
+                existing["last_message_time"] = batch_last
+
+            # 更新昵称（使用最新批次的昵称）
+            nickname = stats.get("nickname", stats.get("name", ""))
+            if nickname:
+                existing["nickname"] = nickname
+
+        # 合并表情统计（按键累加）
+        for emoji_key, count in batch.emoji_stats.items():
+            current_val = state.emoji_counts.get(emoji_key, 0)
+            if isinstance(count, dict):
+                # 如果是嵌套字典（如 face_details），则合并内部计数
+                if not isinstance(current_val, dict):
+                    current_val = {}
+
+                for sub_key, sub_count in count.items():
+                    current_val[sub_key] = current_val.get(sub_key, 0) + sub_count
+
+                state.emoji_counts[emoji_key] = current_val
+            else:
+                # 如果是数值，直接累加
+                if isinstance(current_val, dict):
+                    # 异常情况：现有值是字典但新值是数字，通常不应发生，除非 schema 变更
+                    # 此时保留字典，忽略数字或记录错误，这里选择保留字典
+                    continue
+
+                state.emoji_counts[emoji_key] = current_val + count
+
+        # 合并话题（去重）
+        for topic in batch.topics:
+            if not IncrementalState.is_duplicate_topic(topic, state.topics):
+                state.topics.append(topic)
+
+        # 合并金句（去重）
+        for quote in batch.golden_quotes:
+            if not IncrementalState.is_duplicate_quote(quote, state.golden_quotes):
+                state.golden_quotes.append(quote)
+
+        # 累加 token 消耗
+        for token_key in ("prompt_tokens", "completion_tokens", "total_tokens"):
+            state.total_token_usage[token_key] = state.total_token_usage.get(
+                token_key, 0
+            ) + batch.token_usage.get(token_key, 0)
+
+        # 合并参与者 ID（取并集）
+        state.all_participant_ids.update(batch.participant_ids)
+
+        # 记录最后分析消息时间戳（取最大值）
+        if batch.last_message_timestamp > state.last_analyzed_message_timestamp:
+            state.last_analyzed_message_timestamp = batch.last_message_timestamp
+
     def build_final_statistics(self, state: IncrementalState) -> GroupStatistics:
         """
         从增量状态构建最终的群组统计数据。
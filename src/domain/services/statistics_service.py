@@ -3,8 +3,8 @@
 负责核心统计逻辑的计算，不依赖于具体的平台或基础设施。
 """
 
+import time
 from collections import defaultdict
-from datetime import datetime
 
 from ...infrastructure.visualization.activity_charts import ActivityVisualizer
 from ..models.data_models import EmojiStatistics, GroupStatistics, TokenUsage
@@ -30,12 +30,12 @@ class StatisticsService:
         hour_counts = defaultdict(int)
         emoji_statistics = EmojiStatistics()
 
+        localtime = time.localtime
         for msg in messages:
             participants.add(msg.sender_id)
 
-            # 统计时间分布
-            msg_time = datetime.fromtimestamp(msg.timestamp)
-            hour_counts[msg_time.hour] += 1
+            # 统计时间分布（localtime 比构造 datetime 对象更轻量）
+            hour_counts[localtime(msg.timestamp).tm_hour] += 1
 
             # 处理消息内容
             for content in msg.contents:
@@ -50,10 +50,8 @@ class StatisticsService:
                     )
                 elif content.type == MessageContentType.IMAGE:
                     # 检查是否是动画表情（通过raw_data判断，如果适配器提供了）
-                    if content.raw_data and (
-                        "动画表情" in str(content.raw_data)
-                        or "表情" in str(content.raw_data)
-                    ):
+                    # "表情" 已覆盖 "动画表情"
+                    if content.raw_data and "表情" in str(content.raw_data):
                         emoji_statistics.mface_count += 1
                 elif content.type in (
                     MessageContentType.VOICE,
@@ -70,12 +68,10 @@ class StatisticsService:
             f"{most_active_hour:02d}:00-{(most_active_hour + 1) % 24:02d}:00"
         )
 
-        # 生成活跃度可视化数据
-        # 注意：ActivityVisualizer 可能需要迁移以支持 UnifiedMessage
-        # 目前先转换回 dict 以保持兼容性，或者之后重构它
-        raw_msgs = self._convert_to_legacy_dict(messages)
-        activity_visualization = (
-            self.activity_visualizer.generate_activity_visualization(raw_msgs)
+        # 生成活跃度可视化数据：直接复用本次遍历得到的小时计数，
+        # 无需再转换为 legacy dict 并二次遍历
+        activity_visualization = self.activity_visualizer.build_visualization(
+            hour_counts
         )
 
         return GroupStatistics(
@@ -3,8 +3,6 @@
 专门处理群聊金句提取和分析
 """
 
-from datetime import datetime
-
 from ....domain.models.data_models import GoldenQuote, TokenUsage
 from ....utils.logger import logger
 from ..utils import InfoUtils
@@ -55,7 +53,7 @@ class GoldenQuoteAnalyzer(BaseAnalyzer):
 
         # 构建消息文本
         messages_text = "\n".join(
-            [f"[{msg['time']}] {msg['sender']}: {msg['content']}" for msg in messages]
+            f"[{msg['time']}] {msg['sender']}: {msg['content']}" for msg in messages
         )
 
         max_golden_quotes = self.get_max_count()
@@ -128,7 +126,11 @@ class GoldenQuoteAnalyzer(BaseAnalyzer):
             return []
 
     async def analyze_golden_quotes(
-        self, messages: list[dict], umo: str = None, session_id: str = None
+        self,
+        messages: list[dict],
+        umo: str = None,
+        session_id: str = None,
+        text_rows: list[tuple[str, str, str, list[str]]] | None = None,
     ) -> tuple[list[GoldenQuote], TokenUsage]:
         """
         分析群聊金句
@@ -137,13 +139,16 @@ class GoldenQuoteAnalyzer(BaseAnalyzer):
             messages: 群聊消息列表
             umo: 模型唯一标识符
             session_id: 会话ID (用于调试模式)
+            text_rows: 预先提取的文本行 (可选，见 InfoUtils.collect_text_rows)
 
         Returns:
             (金句列表, Token使用统计)
         """
         try:
             # 提取圣经的文本消息
-            interesting_messages = self.extract_interesting_messages(messages)
+            interesting_messages = self.extract_interesting_messages(
+                messages, text_rows
+            )
 
             if not interesting_messages:
                 logger.info("没有符合条件的圣经消息，返回空结果")
@@ -152,15 +157,23 @@ class GoldenQuoteAnalyzer(BaseAnalyzer):
             logger.info(f"开始从 {len(interesting_messages)} 条圣经消息中提取金句")
             quotes, usage = await self.analyze(interesting_messages, umo, session_id)
 
-            # 回填 User ID
+            # 回填 User ID：先按发送者分组，只在该发送者自己的消息中匹配内容
+            by_sender: dict[str, list[dict]] = {}
+            for msg in interesting_messages:
+                by_sender.setdefault(msg["sender"], []).append(msg)
+
             for quote in quotes:
-                for msg in interesting_messages:
-                    # 尝试匹配内容和发送者
+                quote_content = quote.content
+                quote_len = len(quote_content)
+                for msg in by_sender.get(quote.sender, ()):
                     # 注意：LLM 可能会微调内容，这里使用包含匹配或精确匹配
+                    # 较长的串不可能是较短串的子串，按长度只做一个方向的查找
+                    content = msg["content"]
                     if (
-                        quote.content in msg["content"]
-                        or msg["content"] in quote.content
-                    ) and quote.sender == msg["sender"]:
+                        quote_content in content
+                        if quote_len <= len(content)
+                        else content in quote_content
+                    ):
                         quote.user_id = str(msg.get("user_id", ""))
                         break
 
@@ -170,36 +183,33 @@ class GoldenQuoteAnalyzer(BaseAnalyzer):
             logger.error(f"金句分析失败: {e}")
             return [], TokenUsage()
 
-    def extract_interesting_messages(self, messages: list[dict]) -> list[dict]:
+    def extract_interesting_messages(
+        self,
+        messages: list[dict],
+        text_rows: list[tuple[str, str, str, list[str]]] | None = None,
+    ) -> list[dict]:
         """
         根据清理后的消息提取可能有意义的消息片段用于金句分析。
 
         Args:
             messages: 已由 MessageCleaner 处理过的 legacy 消息列表
+            text_rows: InfoUtils.collect_text_rows 的结果，由调用方共享时传入
 
         Returns:
             提取的文本消息列表
         """
-        interesting_messages = []
-
-        for msg in messages:
-            # 获取发送者显示名
-            sender = msg.get("sender", {})
-            nickname = InfoUtils.get_user_nickname(self.config_manager, sender)
-            msg_time = datetime.fromtimestamp(msg.get("time", 0)).strftime("%H:%M")
-
-            for content in msg.get("message", []):
-                if content.get("type") == "text":
-                    text = content.get("data", {}).get("text", "").strip()
-                    # 过滤掉过短或过长的噪音（已经在 cleaner 处理过一遍基本垃圾）
-                    if 2 <= len(text) <= 500:
-                        interesting_messages.append(
-                            {
-                                "sender": nickname,
-                                "time": msg_time,
-                                "content": text,
-                                "user_id": str(sender.get("user_id", "")),
-                            }
-                        )
-
-        return interesting_messages
+        if text_rows is None:
+            text_rows = InfoUtils.collect_text_rows(self.config_manager, messages)
+
+        # 过滤掉过短或过长的噪音（已经在 cleaner 处理过一遍基本垃圾）
+        return [
+            {
+                "sender": nickname,
+                "time": msg_time,
+                "content": text,
+                "user_id": user_id,
+            }
+            for user_id, nickname, msg_time, texts in text_rows
+            for text in texts
+            if 2 <= len(text) <= 500
+        ]
@@ -3,15 +3,55 @@
 专门处理群聊话题分析
 """
 
-import re
-from datetime import datetime
-
 from ....domain.models.data_models import SummaryTopic, TokenUsage
 from ....utils.logger import logger
 from ..utils import InfoUtils
 from ..utils.json_utils import extract_topics_with_regex
 from .base_analyzer import BaseAnalyzer
 
+# 控制字符（C0 与 C1 区段），清理时直接删除
+_CONTROL_CHARS = dict.fromkeys((*range(0x20), *range(0x7F, 0xA0)))
+
+# build_prompt 的清理表：统一中文引号，换行/制表符替换为空格，删除其余控制字符
+_PROMPT_CLEAN_TABLE = str.maketrans(
+    {
+        **_CONTROL_CHARS,
+        "“": '"',
+        "”": '"',
+        "‘": "'",
+        "’": "'",
+        "\n": " ",
+        "\r": " ",
+        "\t": " ",
+    }
+)
+
+
+def _text_piece(content: dict) -> str:
+    """文本片段：去除首尾空白后的文本"""
+    return content.get("data", {}).get("text", "").strip()
+
+
+def _at_piece(content: dict) -> str:
+    """@ 片段：转换为 @ID 文本（兼容不同平台的 ID 字段）"""
+    at_data = content.get("data", {})
+    at_id = at_data.get("id") or at_data.get("user_id")
+    return f"@{at_id}" if at_id else ""
+
+
+def _reply_piece(content: dict) -> str:
+    """回复片段：转换为 [回复:ID] 标记"""
+    reply_id = content.get("data", {}).get("id", "")
+    return f"[回复:{reply_id}]" if reply_id else ""
+
+
+# 消息片段类型 -> 提示词文本转换函数
+_PIECE_HANDLERS = {
+    "text": _text_piece,
+    "at": _at_piece,
+    "reply": _reply_piece,
+}
+
 
 class TopicAnalyzer(BaseAnalyzer):
     """
@@ -61,58 +101,51 @@ class TopicAnalyzer(BaseAnalyzer):
             logger.warning("build_prompt 收到空消息列表")
             return ""
 
-        # 提取文本消息
-        text_messages = []
+        # 机器人自身 ID 在循环外只取一次
+        bot_ids = frozenset(
+            str(uid) for uid in (self.config_manager.get_bot_self_ids() or ())
+        )
+
+        # 提取文本消息，直接生成提示词中的行
+        # 使用用户提供的 ID-Only 格式: [HH:MM] [用户ID]: 消息内容
+        message_lines = []
+        # 热循环中反复使用的方法预先绑定为局部变量，省去逐次属性查找
+        get_handler = _PIECE_HANDLERS.get
+        format_time = InfoUtils.format_message_time
         for i, msg in enumerate(messages):
             # 确保msg是字典类型，避免'str' object has no attribute 'get'错误
             if not isinstance(msg, dict):
                 continue
 
+            # 消息已由 MessageCleaner 规整为 legacy 字典，按正常结构直接访问；
+            # sender 结构异常时跳过整条消息，单个片段异常时只跳过该片段
             try:
                 sender = msg.get("sender", {})
-                # 确保sender是字典类型，避免'str' object has no attribute 'get'错误
-                if not isinstance(sender, dict):
-                    continue
 
                 # 获取发送者ID并过滤机器人消息
                 user_id = str(sender.get("user_id", ""))
-                bot_self_ids = self.config_manager.get_bot_self_ids()
 
                 # 跳过机器人自己的消息
-                if bot_self_ids and user_id in [str(uid) for uid in bot_self_ids]:
+                if user_id in bot_ids:
                     continue
 
-                nickname = InfoUtils.get_user_nickname(self.config_manager, sender)
-                msg_time = datetime.fromtimestamp(msg.get("time", 0)).strftime("%H:%M")
-
                 message_list = msg.get("message", [])
 
-                # 提取文本内容，可能分布在多个 content 中
+                # 提取文本内容，可能分布在多个 content 中（文本、@、回复）
                 text_parts = []
-                for j, content in enumerate(message_list):
-                    if not isinstance(content, dict):
+                for content in message_list:
+                    try:
+                        handler = get_handler(content.get("type", ""))
+                        piece = handler(content) if handler is not None else ""
+                    except (AttributeError, TypeError):
+                        logger.debug(
+                            "build_prompt 跳过第 %s 条消息中格式异常的片段: %r",
+                            i + 1,
+                            content,
+                        )
                         continue
-
-                    content_type = content.get("type", "")
-
-                    if content_type == "text":
-                        text = content.get("data", {}).get("text", "").strip()
-                        if text:
-                            text_parts.append(text)
-                    elif content_type == "at":
-                        # 处理 @ 消息，转换为文本
-                        at_data = content.get("data", {})
-                        # 兼容不同平台的 ID 字段
-                        at_id = at_data.get("id") or at_data.get("user_id")
-                        if at_id:
-                            at_text = f"@{at_id}"
-                            text_parts.append(at_text)
-                    elif content_type == "reply":
-                        # 处理回复消息，添加标记
-                        reply_id = content.get("data", {}).get("id", "")
-                        if reply_id:
-                            reply_text = f"[回复:{reply_id}]"
-                            text_parts.append(reply_text)
+                    if piece:
+                        text_parts.append(piece)
 
                 # 合并所有文本部分
                 combined_text = "".join(text_parts).strip()
@@ -122,39 +155,25 @@ class TopicAnalyzer(BaseAnalyzer):
                     and len(combined_text) > 2
                     and not combined_text.startswith("/")
                 ):
-                    # 清理消息内容
-                    cleaned_text = combined_text.replace("“", '"').replace("”", '"')
-                    cleaned_text = cleaned_text.replace("‘", "'").replace("’", "'")
-                    cleaned_text = cleaned_text.replace("\n", " ").replace("\r", " ")
-                    cleaned_text = cleaned_text.replace("\t", " ")
-                    cleaned_text = re.sub(r"[\x00-\x1f\x7f-\x9f]", "", cleaned_text)
-
-                    text_messages.append(
-                        {
-                            "sender": nickname,
-                            "time": msg_time,
-                            "content": cleaned_text,
-                            "user_id": str(user_id),
-                        }
-                    )
+                    # 清理消息内容（单次 translate 完成替换与控制字符删除）
+                    cleaned_text = combined_text.translate(_PROMPT_CLEAN_TABLE)
+                    msg_time = format_time(msg.get("time", 0))
+                    message_lines.append(f"[{msg_time}] [{user_id}]: {cleaned_text}")
+            except (AttributeError, TypeError):
+                logger.debug("build_prompt 跳过第 %s 条格式异常的消息", i + 1)
+                continue
             except Exception as e:
                 logger.error(
                     f"build_prompt 处理第 {i + 1} 条消息时出错: {e}", exc_info=True
                 )
                 continue
 
-        if not text_messages:
+        if not message_lines:
             logger.warning("build_prompt 没有提取到有效的文本消息，返回空prompt")
             return ""
 
         # 构建消息文本
-        # 使用用户提供的 ID-Only 格式: [HH:MM] [用户ID]: 消息内容
-        messages_text = "\n".join(
-            [
-                f"[{msg['time']}] [{msg['user_id']}]: {msg['content']}"
-                for msg in text_messages
-            ]
-        )
+        messages_text = "\n".join(message_lines)
 
         max_topics = self.get_max_count()
 
@@ -201,18 +220,19 @@ class TopicAnalyzer(BaseAnalyzer):
             SummaryTopic对象列表
         """
         logger.debug(
-            f"create_data_objects 开始处理，输入数据数量: {len(topics_data) if topics_data else 0}"
+            "create_data_objects 开始处理，输入数据数量: %s，类型: %s",
+            len(topics_data) if topics_data else 0,
+            type(topics_data),
         )
-        logger.debug(f"输入数据类型: {type(topics_data)}")
 
         try:
             topics = []
             max_topics = self.get_max_count()
 
-            logger.debug(f"处理前 {max_topics} 条话题数据")
+            logger.debug("处理前 %s 条话题数据", max_topics)
 
             for i, topic_data in enumerate(topics_data[:max_topics]):
-                logger.debug(f"处理第 {i + 1} 条话题数据，类型: {type(topic_data)}")
+                logger.debug("处理第 %s 条话题数据，类型: %s", i + 1, type(topic_data))
 
                 # 确保topic_data是字典类型，避免'str' object has no attribute 'get'错误
                 if not isinstance(topic_data, dict):
@@ -228,7 +248,10 @@ class TopicAnalyzer(BaseAnalyzer):
                     detail = topic_data.get("detail", "").strip()
 
                     logger.debug(
-                        f"话题数据 - 名称: {topic_name}, 参与者: {contributors}, 详情: {detail[:50]}..."
+                        "话题数据 - 名称: %s, 参与者: %s, 详情: %.50s...",
+                        topic_name,
+                        contributors,
+                        detail,
                     )
 
                     # 验证必要字段
@@ -256,52 +279,49 @@ class TopicAnalyzer(BaseAnalyzer):
                     logger.error(f"处理第 {i + 1} 条话题数据时出错: {e}", exc_info=True)
                     continue
 
-            logger.debug(f"create_data_objects 完成，创建了 {len(topics)} 个话题对象")
+            logger.debug("create_data_objects 完成，创建了 %s 个话题对象", len(topics))
             return topics
 
         except Exception as e:
             logger.error(f"创建话题对象失败: {e}", exc_info=True)
             return []
 
-    def extract_text_messages(self, messages: list[dict]) -> list[dict]:
+    def index_text_senders(
+        self,
+        messages: list[dict],
+        text_rows: list[tuple[str, str, str, list[str]]] | None = None,
+    ) -> tuple[int, dict[str, str]]:
         """
-        从已清理的消息中提取文本消息用于话题分析。
+        统计有效文本片段数量，并建立发送者 ID 到昵称的映射。
+
+        只做 analyze_topics 需要的判定与映射，不再构建文本消息列表；
+        文本的清理与格式化统一由 build_prompt 完成，避免重复解析。
 
         Args:
             messages: 已由 MessageCleaner 处理过的 legacy 消息列表
+            text_rows: InfoUtils.collect_text_rows 的结果，由调用方共享时传入
 
         Returns:
-            提取的文本消息列表
+            (有效文本片段数量, {用户ID: 昵称})
         """
-        text_messages = []
-
-        for msg in messages:
-            # 获取发送者显示名
-            sender = msg.get("sender", {})
-            nickname = InfoUtils.get_user_nickname(self.config_manager, sender)
-            msg_time = datetime.fromtimestamp(msg.get("time", 0)).strftime("%H:%M")
-
-            for content in msg.get("message", []):
-                if content.get("type") == "text":
-                    text = content.get("data", {}).get("text", "").strip()
-                    # 已经在 MessageCleaner 中处理过基本的垃圾内容
-                    if text:
-                        # 简单的额外清理
-                        cleaned_text = text.replace("\n", " ").replace("\r", " ")
-                        cleaned_text = re.sub(r"[\x00-\x1f\x7f-\x9f]", "", cleaned_text)
-
-                        text_messages.append(
-                            {
-                                "sender": nickname,
-                                "time": msg_time,
-                                "content": cleaned_text.strip(),
-                                "user_id": str(sender.get("user_id", "")),
-                            }
-                        )
-        return text_messages
+        if text_rows is None:
+            text_rows = InfoUtils.collect_text_rows(self.config_manager, messages)
+
+        text_count = 0
+        id_to_nickname: dict[str, str] = {}
+        for user_id, nickname, _, texts in text_rows:
+            text_count += len(texts)
+            if nickname and user_id:
+                id_to_nickname[user_id] = nickname
+
+        return text_count, id_to_nickname
 
     async def analyze_topics(
-        self, messages: list[dict], umo: str = None, session_id: str = None
+        self,
+        messages: list[dict],
+        umo: str = None,
+        session_id: str = None,
+        text_rows: list[tuple[str, str, str, list[str]]] | None = None,
     ) -> tuple[list[SummaryTopic], TokenUsage]:
         """
         分析群聊话题
@@ -310,47 +330,37 @@ class TopicAnalyzer(BaseAnalyzer):
             messages: 群聊消息列表
             umo: 模型唯一标识符
             session_id: 会话ID (用于调试模式)
+            text_rows: 预先提取的文本行 (可选，见 InfoUtils.collect_text_rows)
 
         Returns:
             (话题列表, Token使用统计)
         """
         try:
             logger.debug(
-                f"analyze_topics 开始处理，消息数量: {len(messages) if messages else 0}"
+                "analyze_topics 开始处理，消息数量: %s，类型: %s",
+                len(messages) if messages else 0,
+                type(messages),
             )
-            logger.debug(f"消息类型: {type(messages)}")
             if messages:
-                logger.debug(
-                    f"第一条消息类型: {type(messages[0]) if messages else '无'}"
-                )
-                logger.debug(f"第一条消息内容: {messages[0] if messages else '无'}")
+                # 惰性格式化：未开启 DEBUG 时不会把整条消息转成字符串
+                logger.debug("第一条消息内容 (%s): %s", type(messages[0]), messages[0])
 
-            # 检查是否有有效的文本消息
-            text_messages = self.extract_text_messages(messages)
-            logger.debug(f"提取到 {len(text_messages)} 条文本消息")
+            # 检查是否有有效的文本消息，同时建立 ID 到昵称的映射表
+            text_count, id_to_nickname = self.index_text_senders(messages, text_rows)
 
-            if not text_messages:
+            if not text_count:
                 logger.info("没有有效的文本消息，返回空结果")
                 return [], TokenUsage()
 
-            logger.info(f"开始分析 {len(text_messages)} 条文本消息中的话题")
-            logger.debug(f"文本消息类型: {type(text_messages)}")
-            if text_messages:
-                logger.debug(f"第一条文本消息类型: {type(text_messages[0])}")
-                logger.debug(f"第一条文本消息内容: {text_messages[0]}")
-
-            # 建立 ID 到昵称的映射表
-            id_to_nickname = {}
-            for msg in text_messages:
-                sender = msg.get("sender")
-                user_id = msg.get("user_id")
-                if sender and user_id:
-                    id_to_nickname[user_id] = sender
+            logger.info(f"开始分析 {text_count} 条文本消息中的话题")
 
             # 直接传入原始消息，让 build_prompt 方法处理
             topics, usage = await self.analyze(messages, umo, session_id)
 
             # 后处理：contributors 此时包含的是 ID，需要映射回昵称
+            bot_ids = frozenset(
+                str(uid) for uid in (self.config_manager.get_bot_self_ids() or ())
+            )
             for topic in topics:
                 raw_ids = topic.contributors  # LLM 返回的是 ID 列表
 
@@ -368,7 +378,6 @@ class TopicAnalyzer(BaseAnalyzer):
                     name = id_to_nickname.get(uid)
                     if not name:
                         # 尝试去全局配置里找 (e.g. 机器人自己)
-                        bot_ids = self.config_manager.get_bot_self_ids()
                         if uid in bot_ids:
                             name = "Bot"
                         else:
@@ -156,8 +156,10 @@ class UserTitleAnalyzer(BaseAnalyzer):
             准备好的用户数据字典
         """
         try:
-            # 获取机器人 ID 列表用于过滤
-            bot_self_ids = self.config_manager.get_bot_self_ids()
+            # 获取机器人 ID 集合用于过滤
+            bot_ids = frozenset(
+                str(uid) for uid in (self.config_manager.get_bot_self_ids() or ())
+            )
 
             user_summaries = []
 
@@ -179,7 +181,7 @@ class UserTitleAnalyzer(BaseAnalyzer):
             for user_id, stats in user_analysis.items():
                 user_id_str = str(user_id)
                 # 过滤机器人由 MessageCleaner 已处理，此处仅作为二级防御
-                if bot_self_ids and user_id_str in [str(uid) for uid in bot_self_ids]:
+                if user_id_str in bot_ids:
                     continue
 
                 # 只处理活跃用户 (top_users 或 消息数>=5)
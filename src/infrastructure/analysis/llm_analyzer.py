@@ -15,6 +15,7 @@ from ...utils.logger import logger
 from .analyzers.golden_quote_analyzer import GoldenQuoteAnalyzer
 from .analyzers.topic_analyzer import TopicAnalyzer
 from .analyzers.user_title_analyzer import UserTitleAnalyzer
+from .utils.info_utils import InfoUtils
 from .utils.json_utils import fix_json
 from .utils.llm_utils import call_provider_with_retry
 
@@ -150,6 +151,21 @@ class LLMAnalyzer:
             logger.error(f"金句分析失败: {e}")
             return [], TokenUsage()
 
+    def _collect_shared_text_rows(
+        self, messages: list[dict]
+    ) -> list[tuple[str, str, str, list[str]]] | None:
+        """
+        为话题与金句分析预先提取共用的文本行
+
+        提取失败时返回 None，由各分析器在自身的异常处理内重新提取，
+        避免单条异常消息中断整个并发分析（包括用户称号分析）
+        """
+        try:
+            return InfoUtils.collect_text_rows(self.config_manager, messages)
+        except Exception as e:
+            logger.warning(f"预提取共用文本行失败，交由各分析器自行提取: {e}")
+            return None
+
     async def analyze_all_concurrent(
         self,
         messages: list[dict],
@@ -193,13 +209,22 @@ class LLMAnalyzer:
             if self.config_manager.get_debug_mode():
                 self._save_debug_messages(messages, session_id)
 
+            # 话题与金句共用同一份文本行，只遍历一次消息
+            text_rows = (
+                self._collect_shared_text_rows(messages)
+                if topic_enabled or golden_quote_enabled
+                else None
+            )
+
             # 构建并发任务列表
             tasks = []
             task_names = []
 
             if topic_enabled:
                 tasks.append(
-                    self.topic_analyzer.analyze_topics(messages, umo, session_id)
+                    self.topic_analyzer.analyze_topics(
+                        messages, umo, session_id, text_rows
+                    )
                 )
                 task_names.append("topic")
 
@@ -214,7 +239,7 @@ class LLMAnalyzer:
             if golden_quote_enabled:
                 tasks.append(
                     self.golden_quote_analyzer.analyze_golden_quotes(
-                        messages, umo, session_id
+                        messages, umo, session_id, text_rows
                     )
                 )
                 task_names.append("golden_quote")
@@ -313,20 +338,25 @@ class LLMAnalyzer:
             self.golden_quote_analyzer._incremental_max_count = quotes_per_batch
 
             try:
+                # 话题与金句共用同一份文本行，只遍历一次消息
+                text_rows = self._collect_shared_text_rows(messages)
+
                 # 构建并发任务列表（仅话题和金句，不包含用户称号）
                 tasks = []
                 task_names = []
 
                 if topic_enabled:
                     tasks.append(
-                        self.topic_analyzer.analyze_topics(messages, umo, session_id)
+                        self.topic_analyzer.analyze_topics(
+                            messages, umo, session_id, text_rows
+                        )
                     )
                     task_names.append("topic")
 
                 if golden_quote_enabled:
                     tasks.append(
                         self.golden_quote_analyzer.analyze_golden_quotes(
-                            messages, umo, session_id
+                            messages, umo, session_id, text_rows
                         )
                     )
                     task_names.append("golden_quote")
@@ -1,12 +1,24 @@
+from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=2048)
+def _format_minute(minute: int) -> str:
+    """将分钟序号格式化为本地时间 HH:MM"""
+    return datetime.fromtimestamp(minute * 60).strftime("%H:%M")
+
+
 class InfoUtils:
     @staticmethod
-    def get_user_nickname(config_manager, sender) -> str:
+    def get_user_nickname(config_manager, sender, enable_user_card=None) -> str:
         """
         获取用户昵称
 
         优先使用nickname字段,如果为空则使用card(群名片)字段
+        批量调用时可传入预先读取的 enable_user_card，避免逐条读取配置
         """
-        enable_user_card = config_manager.get_enable_user_card()
+        if enable_user_card is None:
+            enable_user_card = config_manager.get_enable_user_card()
         if enable_user_card:
             return (
                 sender.get("card", "")
@@ -19,3 +31,59 @@ class InfoUtils:
                 or sender.get("card", "")
                 or str(sender.get("user_id", ""))
             )
+
+    @staticmethod
+    def format_message_time(timestamp) -> str:
+        """
+        将消息时间戳格式化为 HH:MM
+
+        同一分钟内的消息共享格式化结果，避免逐条调用 strftime
+        """
+        return _format_minute(int(timestamp) // 60)
+
+    @staticmethod
+    def collect_text_rows(
+        config_manager, messages: list[dict]
+    ) -> list[tuple[str, str, str, list[str]]]:
+        """
+        一次遍历消息，提取话题与金句分析共用的发送者信息和文本片段
+
+        Args:
+            config_manager: 配置管理器
+            messages: 已由 MessageCleaner 处理过的 legacy 消息列表
+
+        Returns:
+            [(用户ID, 昵称, HH:MM 时间, 去除首尾空白后的非空文本片段列表)]，
+            不含任何文本片段的消息不会出现在结果中
+        """
+        rows = []
+        # 昵称偏好在本次遍历内不变，只读取一次配置
+        enable_user_card = config_manager.get_enable_user_card()
+
+        # 热循环中反复使用的方法预先绑定为局部变量，省去逐次属性查找
+        append_row = rows.append
+        get_nickname = InfoUtils.get_user_nickname
+        format_time = InfoUtils.format_message_time
+
+        for msg in messages:
+            msg_get = msg.get
+            texts = []
+            for content in msg_get("message", []):
+                if content.get("type") == "text":
+                    text = content.get("data", {}).get("text", "").strip()
+                    if text:
+                        texts.append(text)
+            if not texts:
+                continue
+
+            sender = msg_get("sender", {})
+            append_row(
+                (
+                    str(sender.get("user_id", "")),
+                    get_nickname(config_manager, sender, enable_user_card),
+                    format_time(msg_get("time", 0)),
+                    texts,
+                )
+            )
+
+        return rows
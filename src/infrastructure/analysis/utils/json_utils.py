@@ -8,6 +8,55 @@ import re
 
 from ....utils.logger import logger
 
+# fix_json 使用的中文符号 -> 英文符号映射（引号、逗号、冒号、括号）
+_FULLWIDTH_PUNCT_TABLE = str.maketrans(
+    {
+        "“": '"',
+        "”": '"',
+        "‘": "'",
+        "’": "'",
+        "，": ",",
+        "：": ":",
+        "（": "(",
+        "）": ")",
+        "【": "[",
+        "】": "]",
+    }
+)
+
+# LLM 响应解析用的正则在模块加载时编译一次
+# 字符串值使用展开形式 [^"\\]*(?:\\.[^"\\]*)*：普通字符与转义序列互不重叠，
+# 遇到未闭合、含大量反斜杠的截断输出时也只会线性回溯，不会指数级爆炸
+_JSON_ARRAY_PATTERN = re.compile(r"\[.*?\]", re.DOTALL)
+_QUOTED_PATTERN = re.compile(r'"([^"]+)"')
+
+_TOPIC_PATTERN = re.compile(
+    r'\{\s*"topic":\s*"([^"]+)"\s*,\s*"contributors":\s*\[([^\]]+)\]\s*,\s*"detail":\s*"([^"\\]*(?:\\.[^"\\]*)*)"\s*\}',
+    re.DOTALL,
+)
+_TOPIC_LOOSE_PATTERN = re.compile(
+    r'"topic":\s*"([^"]+)"[^}]*"contributors":\s*\[([^\]]+)\][^}]*"detail":\s*"([^"\\]*(?:\\.[^"\\]*)*)"',
+    re.DOTALL,
+)
+
+_USER_TITLE_PATTERN = re.compile(
+    r'\{\s*"name":\s*"([^"]+)"\s*,\s*"user_id":\s*"([^"]+)"\s*,\s*"title":\s*"([^"]+)"\s*,\s*"mbti":\s*"([^"]+)"\s*,\s*"reason":\s*"([^"\\]*(?:\\.[^"\\]*)*)"\s*\}',
+    re.DOTALL,
+)
+_USER_TITLE_LOOSE_PATTERN = re.compile(
+    r'"name":\s*"([^"]+)"[^}]*"user_id":\s*"([^"]+)"[^}]*"title":\s*"([^"]+)"[^}]*"mbti":\s*"([^"]+)"[^}]*"reason":\s*"([^"\\]*(?:\\.[^"\\]*)*)"',
+    re.DOTALL,
+)
+
+_GOLDEN_QUOTE_PATTERN = re.compile(
+    r'\{\s*"content":\s*"([^"\\]*(?:\\.[^"\\]*)*)"\s*,\s*"sender":\s*"([^"]+)"\s*,\s*"reason":\s*"([^"\\]*(?:\\.[^"\\]*)*)"\s*\}',
+    re.DOTALL,
+)
+_GOLDEN_QUOTE_LOOSE_PATTERN = re.compile(
+    r'"content":\s*"([^"\\]*(?:\\.[^"\\]*)*)"[^}]*"sender":\s*"([^"]+)"[^}]*"reason":\s*"([^"\\]*(?:\\.[^"\\]*)*)"',
+    re.DOTALL,
+)
+
 
 def fix_json(text: str) -> str:
     """
@@ -24,21 +73,11 @@ def fix_json(text: str) -> str:
         text = re.sub(r"```json\s*", "", text)
         text = re.sub(r"```\s*$", "", text)
 
-        # 2. 基础清理
-        text = text.replace("\n", " ").replace("\r", " ")
+        # 2. 基础清理（\s+ 已涵盖换行与回车）
         text = re.sub(r"\s+", " ", text)
 
-        # 3. 替换中文符号为英文符号（修复）
-        # 中文引号 -> 英文引号
-        text = text.replace("“", '"').replace("”", '"')
-        text = text.replace("‘", "'").replace("’", "'")
-        # 中文逗号 -> 英文逗号
-        text = text.replace("，", ",")
-        # 中文冒号 -> 英文冒号
-        text = text.replace("：", ":")
-        # 中文括号 -> 英文括号
-        text = text.replace("（", "(").replace("）", ")")
-        text = text.replace("【", "[").replace("】", "]")
+        # 3. 替换中文符号为英文符号（修复），单次 translate 完成
+        text = text.translate(_FULLWIDTH_PUNCT_TABLE)
 
         # 4. 处理字符串内容中的特殊字符
         # 转义字符串内的双引号
@@ -96,7 +135,7 @@ def parse_json_response(
     """
     try:
         # 1. 提取JSON部分
-        json_match = re.search(r"\[.*?\]", result_text, re.DOTALL)
+        json_match = _JSON_ARRAY_PATTERN.search(result_text)
         if not json_match:
             error_msg = f"{data_type}响应中未找到JSON格式"
             logger.warning(error_msg)
@@ -149,13 +188,11 @@ def extract_topics_with_regex(result_text: str, max_topics: int) -> list[dict]:
     try:
         # 更强的正则表达式提取话题信息，处理转义字符
         # 匹配每个完整的话题对象
-        topic_pattern = r'\{\s*"topic":\s*"([^"]+)"\s*,\s*"contributors":\s*\[([^\]]+)\]\s*,\s*"detail":\s*"([^"]*(?:\\.[^"]*)*)"\s*\}'
-        matches = re.findall(topic_pattern, result_text, re.DOTALL)
+        matches = _TOPIC_PATTERN.findall(result_text)
 
         if not matches:
             # 尝试更宽松的匹配
-            topic_pattern = r'"topic":\s*"([^"]+)"[^}]*"contributors":\s*\[([^\]]+)\][^}]*"detail":\s*"([^"]*(?:\\.[^"]*)*)"'
-            matches = re.findall(topic_pattern, result_text, re.DOTALL)
+            matches = _TOPIC_LOOSE_PATTERN.findall(result_text)
 
         topics = []
         for match in matches[:max_topics]:
@@ -168,8 +205,7 @@ def extract_topics_with_regex(result_text: str, max_topics: int) -> list[dict]:
 
             # 解析参与者列表
             contributors = [
-                contrib.strip()
-                for contrib in re.findall(r'"([^"]+)"', contributors_str)
+                contrib.strip() for contrib in _QUOTED_PATTERN.findall(contributors_str)
             ] or ["群友"]
 
             topics.append(
@@ -203,13 +239,11 @@ def extract_user_titles_with_regex(result_text: str, max_count: int) -> list[dic
         titles = []
 
         # 正则模式：匹配完整的用户称号对象
-        pattern = r'\{\s*"name":\s*"([^"]+)"\s*,\s*"user_id":\s*"([^"]+)"\s*,\s*"title":\s*"([^"]+)"\s*,\s*"mbti":\s*"([^"]+)"\s*,\s*"reason":\s*"([^"]*(?:\\.[^"]*)*)"\s*\}'
-        matches = re.findall(pattern, result_text, re.DOTALL)
+        matches = _USER_TITLE_PATTERN.findall(result_text)
 
         if not matches:
             # 尝试更宽松的匹配（字段顺序可变）
-            pattern = r'"name":\s*"([^"]+)"[^}]*"user_id":\s*"([^"]+)"[^}]*"title":\s*"([^"]+)"[^}]*"mbti":\s*"([^"]+)"[^}]*"reason":\s*"([^"]*(?:\\.[^"]*)*)"'
-            matches = re.findall(pattern, result_text, re.DOTALL)
+            matches = _USER_TITLE_LOOSE_PATTERN.findall(result_text)
 
         for match in matches[:max_count]:
             name = match[0].strip()
@@ -254,13 +288,11 @@ def extract_golden_quotes_with_regex(result_text: str, max_count: int) -> list[d
         quotes = []
 
         # 正则模式：匹配完整的金句对象
-        pattern = r'\{\s*"content":\s*"([^"]*(?:\\.[^"]*)*)"\s*,\s*"sender":\s*"([^"]+)"\s*,\s*"reason":\s*"([^"]*(?:\\.[^"]*)*)"\s*\}'
-        matches = re.findall(pattern, result_text, re.DOTALL)
+        matches = _GOLDEN_QUOTE_PATTERN.findall(result_text)
 
         if not matches:
             # 尝试更宽松的匹配（字段顺序可变）
-            pattern = r'"content":\s*"([^"]*(?:\\.[^"]*)*)"[^}]*"sender":\s*"([^"]+)"[^}]*"reason":\s*"([^"]*(?:\\.[^"]*)*)"'
-            matches = re.findall(pattern, result_text, re.DOTALL)
+            matches = _GOLDEN_QUOTE_LOOSE_PATTERN.findall(result_text)
 
         for match in matches[:max_count]:
             content = match[0].strip()
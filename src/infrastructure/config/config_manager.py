@@ -4,10 +4,29 @@
 """
 
 import sys
+from typing import NamedTuple
 
 from astrbot.api import AstrBotConfig, logger
 from astrbot.core.utils.astrbot_path import get_astrbot_data_path
 
+from ...shared.constants import PLUGIN_NAME
+
+
+class ConfigStatus(NamedTuple):
+    """状态查询所需的配置快照"""
+
+    group_list_mode: str
+    enable_auto_analysis: bool
+    auto_analysis_time: list[str]
+    output_format: str
+    min_messages_threshold: int
+    incremental_enabled: bool
+    incremental_interval_minutes: int
+    incremental_max_daily_analyses: int
+    incremental_active_start_hour: int
+    incremental_active_end_hour: int
+    incremental_report_immediately: bool
+
 
 class ConfigManager:
     """配置管理器
@@ -58,10 +77,16 @@ class ConfigManager:
         if mode == "none":
             return True
 
-        glist = [str(g) for g in self.get_group_list()]
+        glist = self.get_group_list()
         target = str(group_id_or_umo)
 
         target_simple_id = target.split(":")[-1] if ":" in target else target
+
+        # 常见情况（非话题会话）只需精确匹配：UMO 项等于 target，或简单项等于群号
+        if "#" not in target_simple_id:
+            is_in_list = any(str(g) in (target, target_simple_id) for g in glist)
+            return is_in_list if mode == "whitelist" else not is_in_list
+
         target_parent_id = (
             target_simple_id.split("#", 1)[0]
             if "#" in target_simple_id
@@ -96,7 +121,7 @@ class ConfigManager:
             return "#" in target_simple_id and item == target_parent_id
 
         is_in_list = any(
-            _is_match(item, target, target_simple_id, target_parent_id)
+            _is_match(str(item), target, target_simple_id, target_parent_id)
             for item in glist
         )
 
@@ -254,14 +279,13 @@ class ConfigManager:
     def get_pdf_output_dir(self) -> str:
         """获取PDF输出目录"""
         try:
-            plugin_name = "astrbot_plugin_qq_group_daily_analysis"
             data_path = get_astrbot_data_path()
-            default_path = data_path / "plugin_data" / plugin_name / "reports"
+            default_path = data_path / "plugin_data" / PLUGIN_NAME / "reports"
             return self._get_group("pdf").get("pdf_output_dir", str(default_path))
         except Exception:
             return self._get_group("pdf").get(
                 "pdf_output_dir",
-                "data/plugins/astrbot_plugin_qq_group_daily_analysis/reports",
+                f"data/plugins/{PLUGIN_NAME}/reports",
             )
 
     def get_bot_self_ids(self) -> list:
@@ -347,6 +371,44 @@ class ConfigManager:
         self._ensure_group("basic")["group_list"] = groups
         self.config.save_config()
 
+    def mutate_group_list(
+        self, add: str | None = None, remove: tuple[str, ...] = ()
+    ) -> bool:
+        """
+        以增量方式修改群组列表，仅在实际发生变化时写盘一次
+
+        Args:
+            add: 需要追加的 ID（已存在时忽略）
+            remove: 需要移除的 ID 列表（不存在时忽略）
+
+        Returns:
+            是否实际发生了修改
+        """
+        basic = self._ensure_group("basic")
+        glist = basic.setdefault("group_list", [])
+        members = {str(g) for g in glist}
+
+        to_remove = {gid for gid in remove if gid in members}
+        to_add = add if add is not None and add not in members else None
+        if not to_remove and to_add is None:
+            return False
+
+        if to_remove:
+            glist[:] = [g for g in glist if str(g) not in to_remove]
+        if to_add is not None:
+            glist.append(to_add)
+
+        self.config.save_config()
+        return True
+
+    def add_group(self, group_id: str) -> bool:
+        """向群组列表追加一项，已存在时不写盘"""
+        return self.mutate_group_list(add=group_id)
+
+    def remove_group(self, *group_ids: str) -> bool:
+        """从群组列表移除给定的一个或多个 ID，未命中时不写盘"""
+        return self.mutate_group_list(remove=group_ids)
+
     def get_max_concurrent_tasks(self) -> int:
         """获取自动分析最大并发数"""
         return self._get_group("auto_analysis").get("max_concurrent_tasks", 3)
@@ -489,6 +551,26 @@ class ConfigManager:
         """获取多群增量分析的交错间隔（秒），避免 API 压力"""
         return self._get_group("incremental").get("incremental_stagger_seconds", 30)
 
+    def get_all_status(self) -> ConfigStatus:
+        """
+        一次性读取状态展示所需的全部配置项
+
+        逐项委托给对应的 getter，默认值只在各 getter 中维护一份
+        """
+        return ConfigStatus(
+            group_list_mode=self.get_group_list_mode(),
+            enable_auto_analysis=self.get_enable_auto_analysis(),
+            auto_analysis_time=self.get_auto_analysis_time(),
+            output_format=self.get_output_format(),
+            min_messages_threshold=self.get_min_messages_threshold(),
+            incremental_enabled=self.get_incremental_enabled(),
+            incremental_interval_minutes=self.get_incremental_interval_minutes(),
+            incremental_max_daily_analyses=self.get_incremental_max_daily_analyses(),
+            incremental_active_start_hour=self.get_incremental_active_start_hour(),
+            incremental_active_end_hour=self.get_incremental_active_end_hour(),
+            incremental_report_immediately=self.get_incremental_report_immediately(),
+        )
+
     @property
     def playwright_available(self) -> bool:
         """检查playwright是否可用"""
@@ -13,6 +13,7 @@ KV 键设计：
   值: int (epoch timestamp)
 """
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 from ...domain.entities.incremental_state import IncrementalBatch
@@ -26,6 +27,7 @@ class IncrementalStore:
     核心职责：
     - save_batch: 保存单个批次数据并更新索引
     - query_batches: 按时间窗口查询批次列表
+    - iter_batches: 按时间窗口逐个产出批次（流式读取）
     - get_last_analyzed_timestamp / update_last_analyzed_timestamp: 跨批次去重
     - cleanup_old_batches: 清理过期批次
     - get_batch_count: 获取当前批次总数（状态查询用）
@@ -44,6 +46,8 @@ class IncrementalStore:
             star_instance: Star 插件实例，用于访问底层 KV 存储引擎
         """
         self.plugin = star_instance
+        # 每个群的批次索引版本号，索引写入时递增，供上层缓存判断失效
+        self._index_versions: dict[str, int] = {}
 
     # ================================================================
     # 键构建
@@ -102,6 +106,22 @@ class IncrementalStore:
         except Exception as e:
             logger.error(f"保存批次索引失败 (Key: {key}): {e}", exc_info=True)
             raise
+        finally:
+            self._index_versions[group_id] = self._index_versions.get(group_id, 0) + 1
+
+    def get_index_version(self, group_id: str) -> int:
+        """
+        获取指定群批次索引的版本号。
+
+        每次保存或清理批次后递增，版本号不变即说明窗口内批次未变化。
+
+        Args:
+            group_id: 群组 ID
+
+        Returns:
+            int: 当前版本号（进程内计数，从 0 开始）
+        """
+        return self._index_versions.get(group_id, 0)
 
     # ================================================================
     # 批次数据操作
@@ -150,25 +170,25 @@ class IncrementalStore:
             )
             return False
 
-    async def query_batches(
+    async def iter_batches(
         self,
         group_id: str,
         window_start: float,
         window_end: float,
-    ) -> list[IncrementalBatch]:
+    ) -> AsyncIterator[IncrementalBatch]:
         """
-        按时间窗口查询批次列表。
+        按时间窗口逐个产出批次（异步生成器）。
 
-        从索引中筛选时间戳落在 [window_start, window_end] 范围内的批次，
-        逐个加载完整批次数据。
+        与 query_batches 的筛选规则一致，但每次只加载一个批次，
+        调用方可边读边合并，无需在内存中持有全部批次。
 
         Args:
             group_id: 群组 ID
             window_start: 窗口起始时间戳（epoch）
             window_end: 窗口结束时间戳（epoch）
 
-        Returns:
-            list[IncrementalBatch]: 符合窗口范围的批次列表，按时间戳升序
+        Yields:
+            IncrementalBatch: 符合窗口范围的批次，按时间戳升序
         """
         index = await self._get_index(group_id)
 
@@ -182,7 +202,7 @@ class IncrementalStore:
         # 按时间戳升序排列
         matching_entries.sort(key=lambda x: x.get("timestamp", 0))
 
-        batches: list[IncrementalBatch] = []
+        loaded = 0
         for entry in matching_entries:
             batch_id = entry.get("batch_id", "")
             if not batch_id:
@@ -191,26 +211,52 @@ class IncrementalStore:
             batch_key = self._batch_key(group_id, batch_id)
             try:
                 data = await self.plugin.get_kv_data(batch_key, None)
-                if data is not None:
-                    batch = IncrementalBatch.from_dict(data)
-                    batches.append(batch)
-                else:
+                if data is None:
                     logger.warning(
                         f"批次数据缺失 (群 {group_id}, 批次 {batch_id[:8]}...)"
                     )
+                    continue
+                batch = IncrementalBatch.from_dict(data)
             except Exception as e:
                 logger.error(
                     f"加载批次数据失败 (群 {group_id}, 批次 {batch_id[:8]}...): {e}",
                     exc_info=True,
                 )
+                continue
+
+            loaded += 1
+            yield batch
 
         logger.debug(
             f"窗口查询完成: 群 {group_id}, "
             f"窗口 [{window_start:.0f}, {window_end:.0f}], "
-            f"匹配 {len(batches)}/{len(index)} 个批次"
+            f"匹配 {loaded}/{len(index)} 个批次"
         )
 
-        return batches
+    async def query_batches(
+        self,
+        group_id: str,
+        window_start: float,
+        window_end: float,
+    ) -> list[IncrementalBatch]:
+        """
+        按时间窗口查询批次列表。
+
+        从索引中筛选时间戳落在 [window_start, window_end] 范围内的批次，
+        逐个加载完整批次数据。
+
+        Args:
+            group_id: 群组 ID
+            window_start: 窗口起始时间戳（epoch）
+            window_end: 窗口结束时间戳（epoch）
+
+        Returns:
+            list[IncrementalBatch]: 符合窗口范围的批次列表，按时间戳升序
+        """
+        return [
+            batch
+            async for batch in self.iter_batches(group_id, window_start, window_end)
+        ]
 
     # ================================================================
     # 最后分析消息时间戳（跨批次去重用）
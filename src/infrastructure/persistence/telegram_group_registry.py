@@ -1,15 +1,36 @@
 import asyncio
+import time
 from datetime import datetime, timezone
 
 from astrbot.api.star import Star
 
+from ...utils.logger import logger
+
+# 写回 KV 的延迟（秒）与批量阈值：累计更新达到阈值时立即写回
+_FLUSH_DELAY_SECONDS = 2.0
+_FLUSH_BATCH_SIZE = 32
+
+# 秒级 UTC ISO 时间戳缓存：[秒, ISO 字符串]
+_ISO_CACHE: list = [0, ""]
+
+
+def _utc_iso_now() -> str:
+    """返回当前 UTC 时间的 ISO 字符串（秒级精度，同一秒内复用）"""
+    now = int(time.time())
+    cache = _ISO_CACHE
+    if cache[0] != now:
+        cache[0] = now
+        cache[1] = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    return cache[1]
+
 
 class TelegramGroupRegistry:
     """
     Telegram 群组/话题注册表
 
     负责管理 Telegram 的已见群组和话题列表，用于在无法通过 API 获取群列表时提供回退支持。
-    数据存储在 AstrBot 的 KV 存储中。
+    数据存储在 AstrBot 的 KV 存储中；运行期在内存中维护一份副本，
+    更新先写内存，再延迟批量写回 KV，避免每条消息都读写一次 KV。
     """
 
     _KV_KEY = "telegram_seen_groups_v1"
@@ -17,6 +38,52 @@ class TelegramGroupRegistry:
     def __init__(self, plugin_instance: Star):
         self.plugin = plugin_instance
         self._lock = asyncio.Lock()
+        self._registry: dict | None = None
+        self._dirty_count = 0
+        self._flush_task: asyncio.Task | None = None
+        # get_all_group_ids 的结果缓存，仅在出现新群/话题时失效
+        self._group_ids_cache: dict[str | None, list[str]] = {}
+
+    async def _load_registry_unlocked(self) -> dict:
+        """首次访问时从 KV 加载注册表到内存（调用方需持有锁）"""
+        if self._registry is None:
+            registry = await self.plugin.get_kv_data(self._KV_KEY, {})
+            if not isinstance(registry, dict):
+                registry = {}
+            self._registry = registry
+        return self._registry
+
+    async def _flush_unlocked(self) -> None:
+        """将内存中的注册表写回 KV（调用方需持有锁）"""
+        if not self._dirty_count or self._registry is None:
+            return
+        await self.plugin.put_kv_data(self._KV_KEY, self._registry)
+        self._dirty_count = 0
+
+    async def _delayed_flush(self) -> None:
+        """延迟写回，合并这段时间内的所有更新"""
+        await asyncio.sleep(_FLUSH_DELAY_SECONDS)
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning(f"[TGRegistry] 写回 KV 失败: {e}")
+
+    async def flush(self) -> None:
+        """立即将未写回的更新写入 KV。"""
+        async with self._lock:
+            await self._flush_unlocked()
+
+    async def close(self) -> None:
+        """取消延迟写回任务并写回剩余更新（插件卸载时调用）。"""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._flush_task = None
+        # 卸载流程被取消时也要完成最后一次写回
+        await asyncio.shield(self.flush())
 
     async def upsert(
         self,
@@ -28,28 +95,26 @@ class TelegramGroupRegistry:
     ) -> None:
         """更新 Telegram 已见群/话题注册表（KV）。"""
         async with self._lock:
-            registry = await self.plugin.get_kv_data(self._KV_KEY, {})
-            if not isinstance(registry, dict):
-                registry = {}
-
-            platforms = registry.get("platforms")
-            if not isinstance(platforms, dict):
-                platforms = {}
-                registry["platforms"] = platforms
+            registry = await self._load_registry_unlocked()
 
             platform_key = str(platform_id).strip()
             group_key = str(group_id).strip()
 
-            platform_map = platforms.get(platform_key)
+            # setdefault 一次完成查找与插入；isinstance 仅用于修复 KV 中的异常数据
+            platforms = registry.setdefault("platforms", {})
+            if not isinstance(platforms, dict):
+                platforms = registry["platforms"] = {}
+
+            platform_map = platforms.setdefault(platform_key, {})
             if not isinstance(platform_map, dict):
-                platform_map = {}
-                platforms[platform_key] = platform_map
+                platform_map = platforms[platform_key] = {}
 
-            now_iso = datetime.now(timezone.utc).isoformat()
+            now_iso = _utc_iso_now()
 
             entry = platform_map.get(group_key)
             if not isinstance(entry, dict):
-                entry = {}
+                entry = platform_map[group_key] = {}
+                self._group_ids_cache.clear()
 
             first_seen = entry.get("first_seen")
             if not isinstance(first_seen, str) or not first_seen:
@@ -64,25 +129,32 @@ class TelegramGroupRegistry:
                     "last_event_message_id": str(event_message_id),
                 }
             )
-            platform_map[group_key] = entry
 
             registry["updated_at"] = now_iso
-            await self.plugin.put_kv_data(self._KV_KEY, registry)
+
+            self._dirty_count += 1
+            if self._dirty_count >= _FLUSH_BATCH_SIZE:
+                await self._flush_unlocked()
+            elif self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._delayed_flush())
 
     async def get_all_group_ids(self, platform_id: str | None = None) -> list[str]:
         """读取 Telegram 已见群/话题列表。"""
+        cache_key = str(platform_id).strip() if platform_id else None
         async with self._lock:
-            registry = await self.plugin.get_kv_data(self._KV_KEY, {})
-            if not isinstance(registry, dict):
-                return []
+            cached = self._group_ids_cache.get(cache_key)
+            if cached is not None:
+                return list(cached)
+
+            registry = await self._load_registry_unlocked()
 
             platforms = registry.get("platforms")
             if not isinstance(platforms, dict):
                 return []
 
             groups: set[str] = set()
-            if platform_id:
-                platform_map = platforms.get(str(platform_id).strip(), {})
+            if cache_key is not None:
+                platform_map = platforms.get(cache_key, {})
                 if isinstance(platform_map, dict):
                     groups.update(
                         str(gid).strip()
@@ -99,4 +171,6 @@ class TelegramGroupRegistry:
                         if str(gid).strip()
                     )
 
-            return sorted(groups)
+            result = sorted(groups)
+            self._group_ids_cache[cache_key] = result
+            return list(result)
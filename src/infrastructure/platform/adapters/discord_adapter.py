@@ -8,7 +8,9 @@ Discord 平台适配器
 具体实现取决于 AstrBot 的 Discord 集成方式。
 """
 
+import base64
 from datetime import datetime, timedelta
+from io import BytesIO
 from typing import Any
 
 from ....utils.logger import logger
@@ -399,9 +401,6 @@ class DiscordAdapter(PlatformAdapter):
             file_to_send = None
             if image_path.startswith("base64://"):
                 # Base64 图片：解码 -> 内存 Object -> Discord
-                import base64  # Fix: Ensure base64 is imported
-                from io import BytesIO
-
                 try:
                     base64_data = image_path.split("base64://")[1]
                     image_bytes = base64.b64decode(base64_data)
@@ -414,8 +413,6 @@ class DiscordAdapter(PlatformAdapter):
 
             elif image_path.startswith(("http://", "https://")):
                 # 远程图片：下载 -> 内存 Object -> Discord
-                from io import BytesIO
-
                 import aiohttp
 
                 try:
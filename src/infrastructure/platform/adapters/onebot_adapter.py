@@ -59,6 +59,8 @@ class OneBotAdapter(PlatformAdapter):
             config (dict, optional): 插件配置，用于提取机器人自身的 QQ 号供过滤用
         """
         super().__init__(bot_instance, config)
+        # 注册时解析一次 OneBot API 调用入口，避免每次请求都做 hasattr 探测
+        self._call_action = getattr(bot_instance, "call_action", None)
         self.bot_self_ids = (
             [str(id) for id in config.get("bot_qq_ids", [])] if config else []
         )
@@ -184,7 +186,7 @@ class OneBotAdapter(PlatformAdapter):
         before_id: str | None,
     ) -> list[UnifiedMessage]:
         """通过小批次分页 + 退避重试获取 OneBot 历史消息。"""
-        if not hasattr(self.bot, "call_action"):
+        if self._call_action is None:
             return []
 
         max_retries = self._history_api_max_retries
@@ -248,7 +250,7 @@ class OneBotAdapter(PlatformAdapter):
             if cursor_seq is not None:
                 params["message_seq"] = cursor_seq
 
-            result = await self.bot.call_action("get_group_msg_history", **params)
+            result = await self._call_action("get_group_msg_history", **params)
             raw_list = result.get("messages", []) if isinstance(result, dict) else []
             if not raw_list:
                 break
@@ -674,7 +676,7 @@ class OneBotAdapter(PlatformAdapter):
             if reply_to:
                 message.insert(0, {"type": "reply", "data": {"id": reply_to}})
 
-            await self.bot.call_action(
+            await self._call_action(
                 "send_group_msg",
                 group_id=int(group_id),
                 message=message,
@@ -716,7 +718,7 @@ class OneBotAdapter(PlatformAdapter):
 
             message.append({"type": "image", "data": {"file": file_str}})
 
-            await self.bot.call_action(
+            await self._call_action(
                 "send_group_msg",
                 group_id=int(group_id),
                 message=message,
@@ -744,7 +746,7 @@ class OneBotAdapter(PlatformAdapter):
             bool: 上传任务启动是否成功
         """
         try:
-            await self.bot.call_action(
+            await self._call_action(
                 "upload_group_file",
                 group_id=int(group_id),
                 file=file_path,
@@ -770,7 +772,7 @@ class OneBotAdapter(PlatformAdapter):
         Returns:
             bool: 是否发送成功
         """
-        if not hasattr(self.bot, "call_action"):
+        if self._call_action is None:
             return False
 
         try:
@@ -780,7 +782,7 @@ class OneBotAdapter(PlatformAdapter):
                     if "user_id" in node["data"] and "uin" not in node["data"]:
                         node["data"]["uin"] = node["data"]["user_id"]
 
-            await self.bot.call_action(
+            await self._call_action(
                 "send_group_forward_msg",
                 group_id=int(group_id),
                 messages=nodes,
@@ -795,7 +797,7 @@ class OneBotAdapter(PlatformAdapter):
     async def get_group_info(self, group_id: str) -> UnifiedGroup | None:
         """获取指定群组的基础元数据。"""
         try:
-            result = await self.bot.call_action(
+            result = await self._call_action(
                 "get_group_info",
                 group_id=int(group_id),
             )
@@ -817,7 +819,7 @@ class OneBotAdapter(PlatformAdapter):
     async def get_group_list(self) -> list[str]:
         """获取当前机器人已加入的所有群组 ID 列表。"""
         try:
-            result = await self.bot.call_action("get_group_list")
+            result = await self._call_action("get_group_list")
             return [str(g.get("group_id", "")) for g in result or []]
         except Exception:
             return []
@@ -825,7 +827,7 @@ class OneBotAdapter(PlatformAdapter):
     async def get_member_list(self, group_id: str) -> list[UnifiedMember]:
         """拉取整个群组成员列表。"""
         try:
-            result = await self.bot.call_action(
+            result = await self._call_action(
                 "get_group_member_list",
                 group_id=int(group_id),
             )
@@ -852,7 +854,7 @@ class OneBotAdapter(PlatformAdapter):
     ) -> UnifiedMember | None:
         """拉取特定群成员的详细名片及角色信息。"""
         try:
-            result = await self.bot.call_action(
+            result = await self._call_action(
                 "get_group_member_info",
                 group_id=int(group_id),
                 user_id=int(user_id),
@@ -6,6 +6,7 @@ Telegram 平台适配器
 """
 
 import asyncio
+import os
 from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from io import BytesIO
@@ -36,6 +37,9 @@ except ImportError:
     ExtBot = None
     TELEGRAM_AVAILABLE = False
 
+# 视为占位值的发送者名称（小写）
+_PLACEHOLDER_NAMES = frozenset({"unknown", "none", "null", "nil", "undefined"})
+
 
 class TelegramAdapter(PlatformAdapter):
     """
@@ -314,7 +318,7 @@ class TelegramAdapter(PlatformAdapter):
         normalized = str(name).strip()
         if not normalized:
             return True
-        if normalized.lower() in {"unknown", "none", "null", "nil", "undefined"}:
+        if normalized.lower() in _PLACEHOLDER_NAMES:
             return True
         if sender_id and normalized == str(sender_id).strip():
             return True
@@ -580,8 +584,6 @@ class TelegramAdapter(PlatformAdapter):
             return False
 
         try:
-            import os
-
             chat_id, message_thread_id = self._parse_group_id(group_id)
 
             kwargs: dict[str, Any] = {"chat_id": chat_id}
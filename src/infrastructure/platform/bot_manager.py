@@ -3,6 +3,7 @@ Bot实例管理模块 - 基础设施层
 统一管理bot实例的获取、设置和使用
 """
 
+import asyncio
 from typing import Any
 
 from ...utils.logger import logger
@@ -27,6 +28,8 @@ class BotManager:
         self._is_initialized = False
         self._default_platform = "default"  # 默认平台
         self._plugin_instance = None  # 插件实例引用，用于适配器回调
+        # 平台就绪事件：平台加载完成或首个适配器注册后置位
+        self.ready_event = asyncio.Event()
 
     def set_context(self, context):
         """设置AstrBot上下文，并传递给所有支持的适配器"""
@@ -76,6 +79,7 @@ class BotManager:
                     if self._context and hasattr(adapter, "set_context"):
                         adapter.set_context(self._context)
                     self._adapters[platform_id] = adapter
+                    self.ready_event.set()
                     logger.debug(
                         f"已为 {platform_id} ({platform_name}) 创建 PlatformAdapter"
                     )
@@ -301,6 +305,8 @@ class BotManager:
         # 使用新版 API 获取所有平台实例
         platforms = self._context.platform_manager.get_insts()
         discovered = {}
+        # 逐平台日志先收集，循环结束后合并为一条输出
+        platform_log_lines = []
 
         logger.info(
             f"auto_discover_bot_instances: 在管理器中发现 {len(platforms)} 个平台。"
@@ -334,11 +340,6 @@ class BotManager:
                     platform_id = metadata.get("id")
 
             if platform_id:
-                # KNOWLEDGE DISCOVERY: Log metadata for debugging custom IDs
-                logger.info(
-                    f"[群分析插件 BotManager]: Log metadata for debugging custom IDs ,Platform: {platform_id}, Metadata Type: {getattr(metadata, 'type', 'N/A')}, Metadata Name: {getattr(metadata, 'name', 'N/A')}"
-                )
-
                 # 从元数据检测平台名称
                 platform_name = None
                 # 优先使用 type
@@ -367,14 +368,26 @@ class BotManager:
                 # 无论bot客户端状态如何，都存储平台实例
                 self._platforms[platform_id] = platform
 
+                # KNOWLEDGE DISCOVERY: Log metadata for debugging custom IDs
+                line = (
+                    f"  - 平台 {platform_id}: "
+                    f"Metadata Type: {getattr(metadata, 'type', 'N/A')}, "
+                    f"Metadata Name: {getattr(metadata, 'name', 'N/A')}"
+                )
                 if bot_client:
                     self.set_bot_instance(bot_client, platform_id, platform_name)
                     discovered[platform_id] = bot_client
-                else:
-                    logger.info(
-                        f"发现平台 {platform_id} 但客户端未就绪。将进行懒加载。"
+                    platform_log_lines.append(
+                        f"{line}, 客户端: {type(bot_client).__name__}"
                     )
+                else:
                     discovered[platform_id] = platform
+                    platform_log_lines.append(f"{line}, 客户端未就绪，将进行懒加载")
+
+        if platform_log_lines:
+            logger.info(
+                "[群分析插件 BotManager] 平台列表:\n" + "\n".join(platform_log_lines)
+            )
 
         if self._adapters:
             logger.info(
@@ -424,13 +437,18 @@ class BotManager:
 
         if bot_instance:
             # 从事件中获取平台ID
+            # getattr 一次取值，避免 hasattr 后再次访问属性
             platform_id = None
-            if hasattr(event, "get_platform_id"):
-                platform_id = event.get_platform_id()
-            elif hasattr(event, "platform_meta") and hasattr(event.platform_meta, "id"):
-                platform_id = event.platform_meta.id
-            elif hasattr(event, "platform") and isinstance(event.platform, str):
-                platform_id = event.platform
+            get_platform_id = getattr(event, "get_platform_id", None)
+            if get_platform_id is not None:
+                platform_id = get_platform_id()
+            else:
+                meta_id = getattr(getattr(event, "platform_meta", None), "id", None)
+                platform = getattr(event, "platform", None)
+                if meta_id is not None:
+                    platform_id = meta_id
+                elif isinstance(platform, str):
+                    platform_id = platform
 
             self.set_bot_instance(bot_instance, platform_id)
             # 每次都尝试从bot实例提取ID
@@ -453,13 +471,16 @@ class BotManager:
     def _extract_bot_self_id_impl(self, bot_instance):
         """从bot实例中提取ID（通用实现）"""
         # 尝试多种方式获取bot ID
-        if hasattr(bot_instance, "self_id") and bot_instance.self_id:
-            return str(bot_instance.self_id)
-        elif hasattr(bot_instance, "user_id") and bot_instance.user_id:
-            return str(bot_instance.user_id)
+        self_id = getattr(bot_instance, "self_id", None)
+        if self_id:
+            return str(self_id)
+        user_id = getattr(bot_instance, "user_id", None)
+        if user_id:
+            return str(user_id)
         # Discord.py style: client.user.id
-        elif hasattr(bot_instance, "user") and hasattr(bot_instance.user, "id"):
-            return str(bot_instance.user.id)
+        user_id = getattr(getattr(bot_instance, "user", None), "id", None)
+        if user_id is not None:
+            return str(user_id)
         return None
 
     def validate_for_message_fetching(self, group_id: str) -> bool:
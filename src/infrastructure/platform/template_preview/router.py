@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
 
@@ -35,7 +36,7 @@ class TemplatePreviewRouter:
         self,
         event: Any,
         platform_id: str,
-        available_templates: list[str],
+        available_templates: Sequence[str],
     ) -> tuple[bool, list[Any]]:
         """
         处理 /查看模板 交互。
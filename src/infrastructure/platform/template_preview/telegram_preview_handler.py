@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 import time
 import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -48,7 +49,7 @@ class _PreviewSession:
     message_thread_id: int | None
     message_id: int
     requester_id: int
-    templates: list[str]
+    templates: tuple[str, ...]
     index: int
     created_at: float
 
@@ -195,7 +196,7 @@ class TelegramTemplatePreviewHandler:
         self,
         event: AstrMessageEvent,
         platform_id: str,
-        available_templates: list[str],
+        available_templates: Sequence[str],
     ) -> bool:
         """
         在 Telegram 中发送可交互模板预览消息。
@@ -283,7 +284,7 @@ class TelegramTemplatePreviewHandler:
             message_thread_id=message_thread_id,
             message_id=sent_msg.message_id,
             requester_id=requester_id,
-            templates=available_templates.copy(),
+            templates=tuple(available_templates),
             index=index,
             created_at=time.time(),
         )
@@ -343,7 +344,7 @@ class TelegramTemplatePreviewHandler:
         self,
         event: AstrMessageEvent,
         platform_id: str,
-        available_templates: list[str],
+        available_templates: Sequence[str],
     ) -> tuple[bool, list[Any]]:
         """统一处理 Telegram 的 /查看模板 流程。"""
         if not self.supports(event):
@@ -354,7 +355,7 @@ class TelegramTemplatePreviewHandler:
         async def _append_fallback_results() -> None:
             current_template = self.config_manager.get_report_template()
             template_list_str = "\n".join(
-                [f"【{i}】{t}" for i, t in enumerate(available_templates, start=1)]
+                f"【{i}】{t}" for i, t in enumerate(available_templates, start=1)
             )
             results.append(
                 event.plain_result(
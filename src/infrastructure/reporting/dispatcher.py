@@ -1,6 +1,7 @@
 from collections.abc import Callable
 from typing import Any
 
+from ...utils.async_cache import memoize_async
 from ...utils.logger import logger
 from ...utils.trace_context import TraceContext
 
@@ -69,7 +70,8 @@ class ReportDispatcher:
         image_url = None
         html_content = None
         try:
-            # 定义头像获取回调，请求小尺寸头像以优化性能
+            # 定义头像获取回调，请求小尺寸头像以优化性能（本次报告内缓存）
+            @memoize_async
             async def avatar_getter(user_id: str):
                 if not platform_id:
                     return None
@@ -5,7 +5,10 @@
 
 import asyncio
 import base64
+import functools
+import os
 import re
+import sys
 from datetime import datetime
 from pathlib import Path
 
@@ -16,6 +19,21 @@ from ...utils.logger import logger
 from ..visualization.activity_charts import ActivityVisualizer
 from .templates import HTMLTemplates
 
+# {{key}} 占位符
+_PLACEHOLDER_RE = re.compile(r"\{\{([^}]+)\}\}")
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_placeholder_template(
+    template: str,
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    将模板预编译为 (文本片段, 占位符键) 两个元组，
+    渲染时按 文本[0] 值[0] 文本[1] 值[1] ... 顺序拼接。
+    """
+    parts = _PLACEHOLDER_RE.split(template)
+    return tuple(parts[0::2]), tuple(parts[1::2])
+
 
 class ReportGenerator(IReportGenerator):
     """报告生成器"""
@@ -24,6 +42,10 @@ class ReportGenerator(IReportGenerator):
         self.config_manager = config_manager
         self.activity_visualizer = ActivityVisualizer()
         self.html_templates = HTMLTemplates(config_manager)  # 实例化HTML模板管理器
+        # PDF 渲染使用的常驻浏览器（懒加载）
+        self._playwright = None
+        self._pdf_browser = None
+        self._pdf_browser_lock = asyncio.Lock()
 
     async def generate_image_report(
         self,
@@ -362,8 +384,6 @@ class ReportGenerator(IReportGenerator):
         """
         处理话题详情，将 [123456] 格式的用户引用替换为头像+名称的胶囊样式
         """
-        import re
-
         pattern = r"\[(\d+)\]"
         matches = re.findall(pattern, detail)
         if not matches:
@@ -450,22 +470,28 @@ class ReportGenerator(IReportGenerator):
             template: HTML模板字符串
             data: 渲染数据字典
         """
-        result = template
+        # 模板只解析一次（按模板内容缓存），渲染为单次拼接，不再逐键全文替换
+        literals, keys = _compile_placeholder_template(template)
+        pieces = [literals[0]]
+        remaining_placeholders = []
 
-        for key, value in data.items():
+        for key, literal in zip(keys, literals[1:]):
             # 统一使用双大括号格式 {{key}}
-            placeholder = "{{" + key + "}}"
-            result = result.replace(placeholder, str(value))
+            if key in data:
+                pieces.append(str(data[key]))
+            else:
+                placeholder = "{{" + key + "}}"
+                pieces.append(placeholder)
+                remaining_placeholders.append(placeholder)
+            pieces.append(literal)
 
         # 检查是否还有未替换的占位符
-        import re
-
-        if remaining_placeholders := re.findall(r"\{\{[^}]+\}\}", result):
+        if remaining_placeholders:
             logger.warning(
                 f"未替换的占位符 ({len(remaining_placeholders)}个): {remaining_placeholders[:10]}"
             )
 
-        return result
+        return "".join(pieces)
 
     @staticmethod
     def _safe_url_for_log(url: str | None) -> str:
@@ -485,30 +511,21 @@ class ReportGenerator(IReportGenerator):
         3. 读取文件并转换为 Base64，嵌入 HTML
         这是为了解决 Docker/沙箱环境中渲染器无法访问宿主机 file:// 路径的问题。
         """
-        import base64
-
         try:
             # 1. 准备缓存目录
             # 使用 plugin_data 目录以确保持久化和标准结构
             temp_dir = Path(
                 "data/plugin_data/astrbot_plugin_qq_group_daily_analysis/cache/avatars"
             )
-            if not temp_dir.exists():
-                await asyncio.to_thread(temp_dir.mkdir, parents=True, exist_ok=True)
 
             # 使用小尺寸 (40px) 以优化性能
             file_name = f"{user_id}_40.jpg"
             file_path = temp_dir / file_name
 
-            file_content = None
-
-            # 2. 检查缓存
-            if file_path.exists() and file_path.stat().st_size > 0:
-                # 异步读取缓存
-                try:
-                    file_content = await asyncio.to_thread(file_path.read_bytes)
-                except Exception:
-                    pass
+            # 2. 检查缓存（建目录、stat 与读取合并为一次线程调用，不阻塞事件循环）
+            file_content = await asyncio.to_thread(
+                self._read_cached_avatar_sync, temp_dir, file_path
+            )
 
             # 3. 如果无缓存，获取 URL 并下载
             if not file_content:
@@ -593,178 +610,217 @@ class ReportGenerator(IReportGenerator):
             logger.error(f"获取用户头像失败 {user_id}: {e}")
             return self._get_default_avatar_base64()
 
+    @staticmethod
+    def _read_cached_avatar_sync(cache_dir: Path, file_path: Path) -> bytes | None:
+        """确保缓存目录存在并读取已缓存的头像（同步版本，供 asyncio.to_thread 调用）"""
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            if file_path.stat().st_size > 0:
+                return file_path.read_bytes()
+        except OSError:
+            pass
+        return None
+
     def _get_default_avatar_base64(self) -> str:
         """返回默认头像 (灰色圆形占位符)"""
-        import base64
-
         # 一个简单的灰色圆圈 SVG 转 Base64
         svg = '<svg viewBox="0 0 100 100" xmlns="http://www.w3.org/2000/svg"><circle cx="50" cy="50" r="50" fill="#ddd"/></svg>'
         b64 = base64.b64encode(svg.encode("utf-8")).decode("utf-8")
         return f"data:image/svg+xml;base64,{b64}"
 
-    async def _html_to_pdf(self, html_content: str, output_path: str) -> bool:
-        """将 HTML 内容转换为 PDF 文件"""
-        try:
+    async def _get_pdf_browser(self):
+        """
+        获取常驻的 PDF 渲染浏览器实例
+
+        首次调用时启动 Playwright 与 Chromium，之后复用同一个浏览器进程，
+        每次生成 PDF 只创建独立的 context/page，避免重复冷启动浏览器。
+
+        Returns:
+            Browser | None: 可用的浏览器实例，启动失败时返回 None
+        """
+        async with self._pdf_browser_lock:
+            if self._pdf_browser and self._pdf_browser.is_connected():
+                return self._pdf_browser
+
             # 动态导入 playwright
             try:
                 from playwright.async_api import async_playwright
             except ImportError:
                 logger.error("playwright 未安装，无法生成 PDF")
                 logger.info("💡 请尝试运行: pip install playwright")
-                return False
-
-            import os
-            import sys
+                return None
 
             logger.info("启动浏览器进行 PDF 转换 (使用 Playwright)")
 
-            async with async_playwright() as p:
-                browser = None
-
-                executable_path = None
+            await self._close_pdf_browser_unlocked()
+            self._playwright = await async_playwright().start()
+            p = self._playwright
+
+            executable_path = None
+
+            # 0. 优先检查配置的自定义路径
+            custom_browser_path = self.config_manager.get_browser_path()
+            if custom_browser_path:
+                if Path(custom_browser_path).exists():
+                    logger.info(f"使用配置的自定义浏览器路径: {custom_browser_path}")
+                    executable_path = custom_browser_path
+                else:
+                    logger.warning(
+                        f"配置的浏览器路径不存在: {custom_browser_path}，尝试自动检测..."
+                    )
 
-                # 0. 优先检查配置的自定义路径
-                custom_browser_path = self.config_manager.get_browser_path()
-                if custom_browser_path:
-                    if Path(custom_browser_path).exists():
-                        logger.info(
-                            f"使用配置的自定义浏览器路径: {custom_browser_path}"
-                        )
-                        executable_path = custom_browser_path
-                    else:
-                        logger.warning(
-                            f"配置的浏览器路径不存在: {custom_browser_path}，尝试自动检测..."
-                        )
+            # 1. 如果没有自定义路径，尝试自动检测系统浏览器
+            if not executable_path:
+                system_browser_paths = []
+                if sys.platform.startswith("win"):
+                    username = os.environ.get("USERNAME", "")
+                    local_app_data = os.environ.get(
+                        "LOCALAPPDATA", rf"C:\Users\{username}\AppData\Local"
+                    )
+                    program_files = os.environ.get("ProgramFiles", r"C:\Program Files")
+                    program_files_x86 = os.environ.get(
+                        "ProgramFiles(x86)", r"C:\Program Files (x86)"
+                    )
 
-                # 1. 如果没有自定义路径，尝试自动检测系统浏览器
-                if not executable_path:
-                    system_browser_paths = []
-                    if sys.platform.startswith("win"):
-                        username = os.environ.get("USERNAME", "")
-                        local_app_data = os.environ.get(
-                            "LOCALAPPDATA", rf"C:\Users\{username}\AppData\Local"
-                        )
-                        program_files = os.environ.get(
-                            "ProgramFiles", r"C:\Program Files"
-                        )
-                        program_files_x86 = os.environ.get(
-                            "ProgramFiles(x86)", r"C:\Program Files (x86)"
-                        )
+                    system_browser_paths = [
+                        os.path.join(
+                            program_files, r"Google\Chrome\Application\chrome.exe"
+                        ),
+                        os.path.join(
+                            program_files_x86,
+                            r"Google\Chrome\Application\chrome.exe",
+                        ),
+                        os.path.join(
+                            local_app_data, r"Google\Chrome\Application\chrome.exe"
+                        ),
+                        os.path.join(
+                            program_files_x86,
+                            r"Microsoft\Edge\Application\msedge.exe",
+                        ),
+                        os.path.join(
+                            program_files, r"Microsoft\Edge\Application\msedge.exe"
+                        ),
+                    ]
+                elif sys.platform.startswith("linux"):
+                    system_browser_paths = [
+                        "/usr/bin/google-chrome",
+                        "/usr/bin/google-chrome-stable",
+                        "/usr/bin/chromium",
+                        "/usr/bin/chromium-browser",
+                        "/snap/bin/chromium",
+                    ]
+                elif sys.platform.startswith("darwin"):
+                    system_browser_paths = [
+                        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+                        "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge",
+                        "/Applications/Chromium.app/Contents/MacOS/Chromium",
+                    ]
+
+                # 尝试找到可用的系统浏览器
+                for path in system_browser_paths:
+                    if Path(path).exists():
+                        executable_path = path
+                        logger.info(f"使用系统浏览器: {path}")
+                        break
+
+            # 定义默认启动参数
+            launch_kwargs = {
+                "headless": True,
+                "args": [
+                    "--no-sandbox",
+                    "--disable-setuid-sandbox",
+                    "--font-render-hinting=none",
+                ],
+            }
 
-                        system_browser_paths = [
-                            os.path.join(
-                                program_files, r"Google\Chrome\Application\chrome.exe"
-                            ),
-                            os.path.join(
-                                program_files_x86,
-                                r"Google\Chrome\Application\chrome.exe",
-                            ),
-                            os.path.join(
-                                local_app_data, r"Google\Chrome\Application\chrome.exe"
-                            ),
-                            os.path.join(
-                                program_files_x86,
-                                r"Microsoft\Edge\Application\msedge.exe",
-                            ),
-                            os.path.join(
-                                program_files, r"Microsoft\Edge\Application\msedge.exe"
-                            ),
-                        ]
-                    elif sys.platform.startswith("linux"):
-                        system_browser_paths = [
-                            "/usr/bin/google-chrome",
-                            "/usr/bin/google-chrome-stable",
-                            "/usr/bin/chromium",
-                            "/usr/bin/chromium-browser",
-                            "/snap/bin/chromium",
-                        ]
-                    elif sys.platform.startswith("darwin"):
-                        system_browser_paths = [
-                            "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-                            "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge",
-                            "/Applications/Chromium.app/Contents/MacOS/Chromium",
-                        ]
-
-                    # 尝试找到可用的系统浏览器
-                    for path in system_browser_paths:
-                        if Path(path).exists():
-                            executable_path = path
-                            logger.info(f"使用系统浏览器: {path}")
-                            break
-
-                # 定义默认启动参数
-                launch_kwargs = {
-                    "headless": True,
-                    "args": [
-                        "--no-sandbox",
-                        "--disable-setuid-sandbox",
-                        "--font-render-hinting=none",
-                    ],
-                }
+            if executable_path:
+                launch_kwargs["executable_path"] = executable_path
+                launch_kwargs["channel"] = (
+                    "chrome" if "chrome" in executable_path.lower() else "msedge"
+                )
 
+            try:
                 if executable_path:
-                    launch_kwargs["executable_path"] = executable_path
-                    launch_kwargs["channel"] = (
-                        "chrome" if "chrome" in executable_path.lower() else "msedge"
+                    # 如果指定了路径，通常使用 chromium 启动
+                    browser = await p.chromium.launch(**launch_kwargs)
+                else:
+                    # 尝试直接启动，依赖 playwright install
+                    logger.info("尝试启动 Playwright 托管的浏览器...")
+                    browser = await p.chromium.launch(
+                        headless=True, args=launch_kwargs["args"]
                     )
 
-                try:
-                    if executable_path:
-                        # 如果指定了路径，通常使用 chromium 启动
-                        browser = await p.chromium.launch(**launch_kwargs)
-                    else:
-                        # 尝试直接启动，依赖 playwright install
-                        logger.info("尝试启动 Playwright 托管的浏览器...")
-                        browser = await p.chromium.launch(
-                            headless=True, args=launch_kwargs["args"]
-                        )
-
-                except Exception as e:
-                    logger.warning(f"浏览器启动失败: {e}")
-                    if "Executable doesn't exist" in str(e) or "executable at" in str(
-                        e
-                    ):
-                        logger.error("未找到可用的浏览器。")
-                        logger.info(
-                            "💡 请确保已安装 Playwright 浏览器: playwright install chromium"
-                        )
-                        logger.info("💡 或者安装 Google Chrome / Microsoft Edge")
-                    return False
+            except Exception as e:
+                logger.warning(f"浏览器启动失败: {e}")
+                if "Executable doesn't exist" in str(e) or "executable at" in str(e):
+                    logger.error("未找到可用的浏览器。")
+                    logger.info(
+                        "💡 请确保已安装 Playwright 浏览器: playwright install chromium"
+                    )
+                    logger.info("💡 或者安装 Google Chrome / Microsoft Edge")
+                await self._close_pdf_browser_unlocked()
+                return None
 
-                if not browser:
-                    return False
+            self._pdf_browser = browser
+            return browser
 
-                try:
-                    context = await browser.new_context(device_scale_factor=1)
-                    page = await context.new_page()
+    async def _close_pdf_browser_unlocked(self):
+        """关闭常驻浏览器与 Playwright 驱动（调用方需持有锁）"""
+        browser, self._pdf_browser = self._pdf_browser, None
+        playwright, self._playwright = self._playwright, None
+        if browser:
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug(f"关闭 PDF 浏览器失败: {e}")
+        if playwright:
+            try:
+                await playwright.stop()
+            except Exception as e:
+                logger.debug(f"停止 Playwright 失败: {e}")
 
-                    # 设置页面内容
-                    await page.set_content(
-                        html_content, wait_until="networkidle", timeout=60000
-                    )
+    async def close(self):
+        """释放 PDF 渲染使用的常驻浏览器资源（插件卸载时调用）"""
+        async with self._pdf_browser_lock:
+            await self._close_pdf_browser_unlocked()
 
-                    # 生成 PDF
-                    logger.info("开始生成 PDF...")
-                    await page.pdf(
-                        path=output_path,
-                        format="A4",
-                        print_background=True,
-                        margin={
-                            "top": "10mm",
-                            "right": "10mm",
-                            "bottom": "10mm",
-                            "left": "10mm",
-                        },
-                    )
-                    logger.info(f"PDF 生成成功: {output_path}")
-                    return True
+    async def _html_to_pdf(self, html_content: str, output_path: str) -> bool:
+        """将 HTML 内容转换为 PDF 文件"""
+        try:
+            browser = await self._get_pdf_browser()
+            if not browser:
+                return False
 
-                except Exception as e:
-                    logger.error(f"PDF 生成过程出错: {e}")
-                    return False
-                finally:
-                    if browser:
-                        await browser.close()
+            context = await browser.new_context(device_scale_factor=1)
+            try:
+                page = await context.new_page()
+
+                # 设置页面内容
+                await page.set_content(
+                    html_content, wait_until="networkidle", timeout=60000
+                )
+
+                # 生成 PDF
+                logger.info("开始生成 PDF...")
+                await page.pdf(
+                    path=output_path,
+                    format="A4",
+                    print_background=True,
+                    margin={
+                        "top": "10mm",
+                        "right": "10mm",
+                        "bottom": "10mm",
+                        "left": "10mm",
+                    },
+                )
+                logger.info(f"PDF 生成成功: {output_path}")
+                return True
+
+            except Exception as e:
+                logger.error(f"PDF 生成过程出错: {e}")
+                return False
+            finally:
+                await context.close()
 
         except Exception as e:
             logger.error(f"Playwright 运行出错: {e}")
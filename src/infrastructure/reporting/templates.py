@@ -11,6 +11,9 @@ from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 from ...utils.logger import logger
 
+# 模板根目录（导入时计算一次）
+_TEMPLATES_BASE_DIR = os.path.join(os.path.dirname(__file__), "templates")
+
 
 class HTMLTemplates:
     """HTML模板管理类"""
@@ -19,10 +22,12 @@ class HTMLTemplates:
         """初始化Jinja2环境"""
         self.config_manager = config_manager
         # 设置模板根目录
-        self.base_dir = os.path.join(os.path.dirname(__file__), "templates")
+        self.base_dir = _TEMPLATES_BASE_DIR
         # 缓存不同模板的Jinja2环境（多线程安全）
         self._envs = {}
         self._env_lock = threading.Lock()
+        # 模板文件内容缓存 {文件路径: (mtime_ns, 内容)}，文件修改后自动重新读取
+        self._file_cache: dict[str, tuple[int, str]] = {}
 
     def _get_env_sync(self) -> Environment:
         """获取当前配置的模板环境（同步版本，供 asyncio.to_thread 调用）"""
@@ -64,17 +69,33 @@ class HTMLTemplates:
         return self._get_env_sync()
 
     def _read_template_file_sync(self, filename: str) -> str:
-        """同步读取模板文件内容"""
+        """同步读取模板文件内容（按 mtime 缓存）"""
+        mtime_ns = os.stat(filename).st_mtime_ns
+        cached = self._file_cache.get(filename)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         with open(filename, encoding="utf-8") as f:
-            return f.read()
+            content = f.read()
+        self._file_cache[filename] = (mtime_ns, content)
+        return content
+
+    def _read_env_file_sync(self, env: Environment, filename: str) -> str:
+        """读取模板环境目录下的原始模板文件
+
+        原始字符串无需 Jinja2 编译，直接按路径读取；
+        文件缓存以 mtime 校验，稳态下每次只需一次 stat()。
+        """
+        return self._read_template_file_sync(
+            os.path.join(env.loader.searchpath[0], filename)
+        )
 
     async def get_image_template_async(self) -> str:
         """获取图片报告的HTML模板（异步版本，返回原始模板字符串）"""
         try:
             env = await self._get_env_async()
-            template = env.get_template("image_template.html")
             return await asyncio.to_thread(
-                self._read_template_file_sync, template.filename
+                self._read_env_file_sync, env, "image_template.html"
             )
         except Exception as e:
             logger.error(f"加载图片模板失败: {e}")
@@ -84,9 +105,7 @@ class HTMLTemplates:
         """获取图片报告的HTML模板（同步版本，向后兼容）"""
         try:
             env = self._get_env()
-            template = env.get_template("image_template.html")
-            with open(template.filename, encoding="utf-8") as f:
-                return f.read()
+            return self._read_env_file_sync(env, "image_template.html")
         except Exception as e:
             logger.error(f"加载图片模板失败: {e}")
             return ""
@@ -95,9 +114,8 @@ class HTMLTemplates:
         """获取PDF报告的HTML模板（异步版本，返回原始模板字符串）"""
         try:
             env = await self._get_env_async()
-            template = env.get_template("pdf_template.html")
             return await asyncio.to_thread(
-                self._read_template_file_sync, template.filename
+                self._read_env_file_sync, env, "pdf_template.html"
             )
         except Exception as e:
             logger.error(f"加载PDF模板失败: {e}")
@@ -107,9 +125,7 @@ class HTMLTemplates:
         """获取PDF报告的HTML模板（同步版本，向后兼容）"""
         try:
             env = self._get_env()
-            template = env.get_template("pdf_template.html")
-            with open(template.filename, encoding="utf-8") as f:
-                return f.read()
+            return self._read_env_file_sync(env, "pdf_template.html")
         except Exception as e:
             logger.error(f"加载PDF模板失败: {e}")
             return ""
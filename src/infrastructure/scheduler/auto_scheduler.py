@@ -10,6 +10,7 @@ from typing import Any
 
 from apscheduler.triggers.cron import CronTrigger
 
+from ...shared.constants import PLUGIN_NAME
 from ...utils.logger import logger
 from ...utils.trace_context import TraceContext
 from ..messaging.message_sender import MessageSender
@@ -150,7 +151,7 @@ class AutoScheduler:
                 trigger = CronTrigger(hour=int(hour), minute=int(minute))
 
                 # 任务 ID
-                job_id = f"astrbot_plugin_qq_group_daily_analysis_trigger_{i}"
+                job_id = f"{PLUGIN_NAME}_trigger_{i}"
 
                 # 添加任务
                 scheduler.add_job(
@@ -806,9 +807,7 @@ class AutoScheduler:
 
         for platform_id, bot_instance in self.bot_manager._bot_instances.items():
             # 检查该平台是否启用了此插件
-            if not self.bot_manager.is_plugin_enabled(
-                platform_id, "astrbot_plugin_qq_group_daily_analysis"
-            ):
+            if not self.bot_manager.is_plugin_enabled(platform_id, PLUGIN_NAME):
                 logger.debug(f"平台 {platform_id} 未启用此插件，跳过获取群列表")
                 continue
 
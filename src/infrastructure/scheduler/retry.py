@@ -1,5 +1,6 @@
 import asyncio
 import base64
+import os
 import random
 import time
 from collections.abc import Callable
@@ -9,6 +10,10 @@ import aiohttp
 
 from ...utils.logger import logger
 
+# 文本回退消息的前缀与长度上限
+_FALLBACK_TEXT_PREFIX = "⚠️ 图片报告生成失败，文本报告：\n"
+_FALLBACK_TEXT_LIMIT = 4500
+
 
 @dataclass
 class RetryTask:
@@ -79,9 +84,8 @@ class RetryManager:
     ):
         """添加重试任务"""
         if not self.running:
-            logger.warning(
-                "[RetryManager] 警告：添加任务时管理器未运行，正在尝试启动..."
-            )
+            # worker 按需懒启动：没有失败任务时不常驻后台协程
+            logger.info("[RetryManager] 首次加入重试任务，启动重试工作进程")
             await self.start()
 
         task = RetryTask(
@@ -178,8 +182,6 @@ class RetryManager:
                 else:
                     # 本地文件路径
                     try:
-                        import os
-
                         if os.path.exists(image_data):
                             with open(image_data, "rb") as f:
                                 image_data = f.read()
@@ -294,9 +296,10 @@ class RetryManager:
             else:
                 # 最终兜底：发送简单文本
                 logger.warning("[RetryManager] 结构化发送失败，尝试直接发送文本回退")
+                # 先截断报告再拼接，避免为超长报告构造完整字符串
+                body_limit = _FALLBACK_TEXT_LIMIT - len(_FALLBACK_TEXT_PREFIX)
                 await adapter.send_text(
-                    task.group_id,
-                    f"⚠️ 图片报告生成失败，文本报告：\n{text_report}"[:4500],
+                    task.group_id, _FALLBACK_TEXT_PREFIX + text_report[:body_limit]
                 )
 
         except Exception as e:
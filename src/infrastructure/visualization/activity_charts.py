@@ -53,6 +53,18 @@ class ActivityVisualizer:
                     if "动画表情" in summary or "表情" in summary:
                         emoji_activity[hour] += 1
 
+        return self.build_visualization(hourly_activity, emoji_activity, user_activity)
+
+    def build_visualization(
+        self,
+        hourly_activity: dict[int, int],
+        emoji_activity: dict[int, int] | None = None,
+        user_activity: dict | None = None,
+    ) -> ActivityVisualization:
+        """基于已聚合的小时计数生成活跃度可视化数据，避免重复遍历消息"""
+        emoji_activity = emoji_activity or {}
+        user_activity = user_activity or {}
+
         # 生成用户活跃度排行
         user_ranking = []
         for user_id, data in user_activity.items():
@@ -0,0 +1,36 @@
+"""
+异步回调缓存工具
+用于在一次报告生成过程中复用头像、昵称等查询结果
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def memoize_async(func: Callable[[str], Awaitable[T]]) -> Callable[[str], Awaitable[T]]:
+    """
+    为单参数异步回调增加结果缓存。
+
+    同一参数的并发调用共享同一个任务，只会真正请求一次；
+    缓存随返回的包装函数存在，适合在单次命令/报告生成内使用。
+
+    Args:
+        func: 接收字符串参数的异步函数（如 user_id -> 头像 URL）
+
+    Returns:
+        带缓存的异步函数
+    """
+    tasks: dict[str, asyncio.Future] = {}
+
+    async def wrapper(key: str) -> T:
+        task = tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(key))
+            tasks[key] = task
+        # shield: 某个调用方被取消时不影响共享任务
+        return await asyncio.shield(task)
+
+    return wrapper